@@ -1,7 +1,34 @@
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
 import time
+import random
+import email.utils
 import urllib3
 import re
+import ast
+import logging
+import json
+import functools
+import threading
+import sqlite3
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, Counter, defaultdict
+try:
+    import orjson #Optional: a faster JSON parser, used for the responses if installed
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+try:
+    import brotli #Optional: lets responses be Brotli-compressed (decoded by urllib3), smaller than gzip
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    try:
+        import brotlicffi
+        _ACCEPT_ENCODING = 'br, gzip, deflate'
+    except ImportError:
+        _ACCEPT_ENCODING = 'gzip, deflate'
 
 """
 Module with functions to query Wikidata using the SPARQL API and process the results.
@@ -9,6 +36,8 @@ Particularly, functions to query information about (multiple) people, such as th
 
 There are NO! dependencies (other than the standard library) for this module, with
     the exception of the 'pandas' library if you intend to use the 'results_dataframe' function.
+    If the 'orjson' library is installed, it is used to parse responses faster (optional).
+    If the 'brotli' (or 'brotlicffi') library is installed, responses are requested Brotli-compressed (optional).
 Created by: Mihaly Hanics, 2024
 
 Common inputs:
@@ -19,14 +48,303 @@ Common inputs:
     retries (int): Maximum number of retries, in case of a status code error.
     delay or delays (int|list of int): Delay time(s) for retries.
     silent (bool): Whether to print out errors or not.
+    chunk_size (int): Number of people (names or IDs) queried in one request, when querying multiple people.
+        Bigger chunks mean fewer requests, but every chunk query has to finish within the endpoint's 60 seconds limit
+        (the failed chunks are retried person by person in the '..._retry_missing' functions).
+    max_workers (int): Number of chunk queries running at the same time (Wikidata throttles many parallel queries, keep it about 4-8).
 
     placeofbirth, dateofbirth, dateofdeath, placeofdeath, worklocation, gender, citizenship, occupation (bool): Bools whether to include the attribute in the query.
     ..._return (bool): Same as above: Bools whether to return the attribute in the response.
 """
 
+####################################### HTTP session #######################################
+
+#Request errors and retries are logged as warnings (shown by default); use logging.getLogger("functions").setLevel(...) to filter them
+_logger = logging.getLogger(__name__)
+
+#One shared session for all queries: keeps the connection to the endpoint alive between calls,
+#so the TCP+TLS handshake is only paid once instead of for every query.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=0)) #Retries are handled by us
+#Wikidata's policy asks for a descriptive User-Agent (generic ones get blocked more often)
+_SESSION.headers.update({
+    'User-Agent': 'wikidata-SparQL-data-collection (https://github.com/me9hanics/wikidata-SparQL-data-collection)',
+    'Accept': 'application/sparql-results+json',
+    'Accept-Encoding': _ACCEPT_ENCODING, #Results compress well, the payload size is the bottleneck for big queries
+})
+_TIMEOUT = (5, 65) #(connect, read) timeouts in seconds; the endpoint itself stops queries after 60 seconds
+#Queries longer than this (in characters) are sent with POST (form body), as the endpoint recommends for larger queries:
+#servers and proxies reject too long URLs (414 errors). Short ones (e.g. ID lookups by name) stay GET requests,
+#as only those can be answered from the endpoint's cache.
+_MAX_GET_QUERY_LENGTH = 1024
+#Only temporary errors (timeout, too early, rate limit, server errors) are retried. Other status codes (e.g. 400 for a
+#malformed query, 403, 404) would come back the same for the same query, so we give up on them immediately.
+_RETRY_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+#Longest wait (in seconds) we accept from a 'Retry-After' header, so a far-off value or date cannot stall the caller
+_MAX_RETRY_AFTER = 120
+
+#Successful responses are kept in memory (least recently used ones are dropped first),
+#so repeating a query (e.g. duplicate names, re-running a cell) does not hit the network again.
+#The size is bounded by the response bodies' length too: parsed responses take several times that much memory.
+#Bigger responses (e.g. the multi-person chunk queries) are not kept in memory at all, only on disk if enabled.
+_QUERY_CACHE = OrderedDict() #cache key -> (parsed response, body length in bytes)
+_QUERY_CACHE_MAXSIZE = 4096
+_QUERY_CACHE_MAX_BYTES = 32 * 1024**2
+_QUERY_CACHE_MAX_ENTRY_BYTES = 1024**2
+_QUERY_CACHE_BYTES = 0
+_QUERY_CACHE_LOCK = threading.Lock() #Queries can run in parallel threads
+
+#Optional on-disk cache (SQLite), to keep responses between sessions/runs; off by default, see 'enable_disk_cache'
+_DISK_CACHE = None
+_DISK_CACHE_EXPIRE_AFTER = None
+_DISK_CACHE_LOCK = threading.Lock()
+
+#Requests are paced by a token bucket shared by all threads (e.g. the async functions), so we stay within the
+#endpoint's request rate instead of running into 429 errors and waiting the long retry delays.
+#Up to _RATE_LIMIT_BURST requests are sent at once, then one every 60/_RATE_LIMIT_PER_MINUTE seconds.
+#Each endpoint has its own bucket, and only requests actually sent are paced (not cached responses).
+#Change it (or turn it off) with 'set_rate_limit'.
+_RATE_LIMIT_PER_MINUTE = 50
+_RATE_LIMIT_BURST = 10
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket: 'acquire' blocks until a request may be sent.
+    """
+    def __init__(self, rate_per_minute, capacity):
+        self.rate = rate_per_minute / 60 #tokens per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock: #Holding the lock while sleeping keeps the waiting threads in order
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1
+                self.updated = time.monotonic()
+            self.tokens -= 1
+
+    def pause(self, seconds):
+        """
+        Let no request through for the given time (e.g. after a 429 response), then continue at the normal rate.
+        """
+        with self.lock:
+            #Tokens are counted from 'updated' on, so a future 'updated' makes 'acquire' wait until then (for 1 token)
+            self.tokens = 1
+            self.updated = max(self.updated, time.monotonic() + seconds)
+
+
+_RATE_LIMITERS = {} #Endpoint URL: _TokenBucket
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def _rate_limiter(endpoint_url):
+    """
+    The token bucket of an endpoint (created at its first request), None if rate limiting is turned off.
+    """
+    with _RATE_LIMITERS_LOCK:
+        if _RATE_LIMIT_PER_MINUTE is None:
+            return None
+        if endpoint_url not in _RATE_LIMITERS:
+            _RATE_LIMITERS[endpoint_url] = _TokenBucket(_RATE_LIMIT_PER_MINUTE, _RATE_LIMIT_BURST)
+        return _RATE_LIMITERS[endpoint_url]
+
+
+def _normalize_query(query):
+    """
+    Canonical form of a query for caching: strips the indentation and empty lines,
+    so the same query written with different indentation is cached only once.
+    Whitespace inside lines is kept (it may be part of a string literal, e.g. a name).
+    """
+    return "\n".join(line.strip() for line in query.splitlines() if line.strip())
+
+
+def _retry_delay(response, attempt, delays=None):
+    """
+    Time to wait before retrying a failed request.
+    If the server sent a 'Retry-After' header (in seconds or as a date), wait as long as it asks (at most _MAX_RETRY_AFTER).
+    Otherwise wait delays[attempt] seconds, or if no delays are given, back off exponentially (1, 2, 4.. seconds, at most 60).
+    In both cases a random jitter of up to 1 second is added, so parallel queries do not all retry at the same moment.
+
+    Parameters:
+    - response (requests.Response or None): The failed response (None if there was no response, e.g. timeout).
+    - attempt (int): Index of the failed attempt, starting from 0.
+    - delays (list of int or None): Delay times for each attempt.
+
+    Returns:
+    - float: Seconds to wait.
+    """
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    delay = None
+    if retry_after:
+        if retry_after.strip().isdigit():
+            delay = int(retry_after)
+        else:
+            try:
+                retry_date = email.utils.parsedate_to_datetime(retry_after)
+                delay = max(0, retry_date.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass #Unknown format, fall back to our own delays
+        if delay is not None:
+            delay = min(delay, _MAX_RETRY_AFTER)
+    if delay is None:
+        if delays:
+            delay = delays[min(attempt, len(delays) - 1)]
+        else:
+            delay = min(60, 2**attempt)
+    return delay + random.uniform(0, 1)
+
+
+def _wait_before_retry(response, attempt, retries, delays=None, deadline=None, rate_limiter=None):
+    """
+    Wait before retrying a failed request (see '_retry_delay'), unless there is no point in retrying.
+    After a 429 (rate limited) response, the endpoint's rate limiter is paused instead, so the other threads
+        wait too; the retry then waits for the limiter (when acquiring its next token), not here.
+
+    Parameters:
+    - response, attempt, delays: See at '_retry_delay'.
+    - retries (int): Maximum number of attempts; after the last one we do not wait.
+    - deadline (float or None): time.monotonic() value after which we do not retry anymore.
+    - rate_limiter (_TokenBucket or None): The rate limiter of the endpoint.
+
+    Returns:
+    - bool: True if the request should be retried, False if we should give up.
+    """
+    if attempt >= retries - 1:
+        return False #That was the last attempt, waiting would be wasted time
+    delay = _retry_delay(response, attempt, delays)
+    if deadline is not None and time.monotonic() + delay > deadline:
+        _logger.warning("Not retrying, waiting %.0f seconds would exceed the time budget.", delay)
+        return False
+    if rate_limiter is not None and response is not None and response.status_code == 429:
+        rate_limiter.pause(delay)
+    else:
+        time.sleep(delay)
+    return True
+
+
+def enable_disk_cache(path="wikidata_cache.sqlite", expire_after=7*24*3600):
+    """
+    Also keep successful responses in an SQLite file, so repeated queries are answered locally even in later runs
+    (e.g. when re-running a notebook, or an interrupted crawl).
+
+    Parameters:
+    - path (str): Path of the SQLite file (created if it does not exist).
+    - expire_after (int|float or None): Seconds after which a stored response is fetched again. None: never expires.
+    """
+    global _DISK_CACHE, _DISK_CACHE_EXPIRE_AFTER
+    connection = sqlite3.connect(path, check_same_thread=False) #Used from parallel threads, guarded by _DISK_CACHE_LOCK
+    connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, created REAL, body BLOB)")
+    connection.commit()
+    with _DISK_CACHE_LOCK:
+        if _DISK_CACHE is not None:
+            _DISK_CACHE.close()
+        _DISK_CACHE, _DISK_CACHE_EXPIRE_AFTER = connection, expire_after
+
+
+def disable_disk_cache():
+    """
+    Stop using the on-disk cache (the file is kept).
+    """
+    global _DISK_CACHE
+    with _DISK_CACHE_LOCK:
+        if _DISK_CACHE is not None:
+            _DISK_CACHE.close()
+        _DISK_CACHE = None
+
+
+def set_rate_limit(rate_per_minute=50, burst=10):
+    """
+    Change how fast requests are sent to each endpoint (see _RATE_LIMIT_PER_MINUTE), e.g. for a private endpoint.
+
+    Parameters:
+    - rate_per_minute (int|float or None): Maximum requests per minute and endpoint, must be positive. None: no rate limiting.
+    - burst (int): Number of requests that can be sent at once before the pacing starts, at least 1.
+    """
+    global _RATE_LIMIT_PER_MINUTE, _RATE_LIMIT_BURST
+    if rate_per_minute is not None and not rate_per_minute > 0: #A rate of 0 would never refill the bucket
+        raise ValueError("rate_per_minute should be a positive number, or None for no rate limiting.")
+    if not burst >= 1:
+        raise ValueError("burst should be at least 1.")
+    with _RATE_LIMITERS_LOCK:
+        _RATE_LIMIT_PER_MINUTE, _RATE_LIMIT_BURST = rate_per_minute, burst
+        _RATE_LIMITERS.clear() #New buckets with the new rate
+
+
+def _disk_cache_key(cache_key):
+    return hashlib.sha256("\n".join(cache_key).encode("utf-8")).hexdigest()
+
+
+def _disk_cache_get(cache_key):
+    """
+    Get the stored response body (bytes) of a query from the on-disk cache, None if it is not stored (or expired).
+    """
+    with _DISK_CACHE_LOCK:
+        if _DISK_CACHE is None:
+            return None
+        row = _DISK_CACHE.execute("SELECT created, body FROM responses WHERE key = ?", (_disk_cache_key(cache_key),)).fetchone()
+        expire_after = _DISK_CACHE_EXPIRE_AFTER
+    if row is None or (expire_after is not None and time.time() - row[0] > expire_after):
+        return None
+    return row[1]
+
+
+def _disk_cache_set(cache_key, body):
+    """
+    Store the response body (bytes) of a query in the on-disk cache, if it is enabled.
+    """
+    with _DISK_CACHE_LOCK:
+        if _DISK_CACHE is not None:
+            _DISK_CACHE.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (_disk_cache_key(cache_key), time.time(), body))
+            _DISK_CACHE.commit()
+
+
+def _memory_cache_set(cache_key, response_json, size):
+    """
+    Store a parsed response in the in-memory cache, dropping the least recently used ones while it is over
+    _QUERY_CACHE_MAXSIZE entries or _QUERY_CACHE_MAX_BYTES (counting the length of the response bodies).
+    """
+    global _QUERY_CACHE_BYTES
+    with _QUERY_CACHE_LOCK:
+        if cache_key in _QUERY_CACHE:
+            _QUERY_CACHE_BYTES -= _QUERY_CACHE.pop(cache_key)[1]
+        _QUERY_CACHE[cache_key] = (response_json, size)
+        _QUERY_CACHE_BYTES += size
+        while len(_QUERY_CACHE) > _QUERY_CACHE_MAXSIZE or _QUERY_CACHE_BYTES > _QUERY_CACHE_MAX_BYTES:
+            _QUERY_CACHE_BYTES -= _QUERY_CACHE.popitem(last=False)[1][1]
+
+
+def clear_cache():
+    """
+    Empty the cache of SPARQL responses (e.g. to fetch fresh data from Wikidata): in memory, and on disk if enabled.
+    """
+    global _QUERY_CACHE_BYTES
+    with _QUERY_CACHE_LOCK:
+        _QUERY_CACHE.clear()
+        _QUERY_CACHE_BYTES = 0
+    with _DISK_CACHE_LOCK:
+        if _DISK_CACHE is not None:
+            _DISK_CACHE.execute("DELETE FROM responses")
+            _DISK_CACHE.commit()
+
+
+def close_session():
+    """
+    Close the kept-alive connections of the shared HTTP session (e.g. at the end of a script).
+    The session can still be used afterwards, new connections are opened when needed.
+    """
+    _SESSION.close()
+
 ####################################### Basic SparQL query functions #######################################
 
-def sparql_query(query,  retries=3, delay=10, endpoint_url="https://query.wikidata.org/sparql"):
+def sparql_query(query,  retries=3, delay=10, endpoint_url="https://query.wikidata.org/sparql", use_cache=True, time_budget=None,
+                 force_refresh=False):
     """
     Make a SPARQL query API call to the Wikidata endpoint.
 
@@ -40,36 +358,145 @@ def sparql_query(query,  retries=3, delay=10, endpoint_url="https://query.wikida
     - endpoint_url (str): the URL of the (SPARQL) endpoint, should be "https://query.wikidata.org/sparql" in all cases,
         unless you manually want to change it to another endpoint.
     - retries, delay: See at the top of the file.
+    - use_cache (bool): Whether to return a cached response if the same query was already run successfully
+        (in this session, or earlier if the on-disk cache is enabled, see 'enable_disk_cache').
+        The cached response is shared between calls, do not modify it in place (copy it first if needed).
+        Responses over _QUERY_CACHE_MAX_ENTRY_BYTES are only cached on disk, not in memory.
+    - force_refresh (bool): Fetch the response from the endpoint even if it is cached, and update the cache with it.
+    - time_budget (int|float or None): Maximum total time (in seconds) to spend on retries for this query.
+        If waiting for the next retry would exceed it, give up. None means no limit (only 'retries' counts).
 
     Returns:
     - dict or None: The JSON response of the query if successful, None otherwise.
     """
+    cache_key = (endpoint_url, _normalize_query(query))
+    if use_cache and not force_refresh:
+        with _QUERY_CACHE_LOCK:
+            if cache_key in _QUERY_CACHE:
+                _QUERY_CACHE.move_to_end(cache_key)
+                return _QUERY_CACHE[cache_key][0]
+
+    body = _disk_cache_get(cache_key) if use_cache and not force_refresh else None
+    if body is None:
+        response = _request_with_retries(query, retries, delay, endpoint_url, time_budget=time_budget)
+        if response is None:
+            return None
+        body = response.content
+        try:
+            response_json = _json_loads(body)
+        except ValueError as e: #E.g. a response cut off when the query timed out while streaming the results
+            _logger.warning("Invalid JSON response (%s), not caching it.", e)
+            return None
+        if use_cache:
+            _disk_cache_set(cache_key, body) #Only bodies that could be parsed
+    else:
+        response_json = _json_loads(body)
+    if use_cache and len(body) <= _QUERY_CACHE_MAX_ENTRY_BYTES:
+        _memory_cache_set(cache_key, response_json, len(body))
+    return response_json
+
+sparql_query.cache_clear = clear_cache #Same interface as functools.lru_cache
+
+
+def sparql_query_bindings(query, retries=3, delay=10, endpoint_url="https://query.wikidata.org/sparql", time_budget=None):
+    """
+    Make a SPARQL query like 'sparql_query', but yield the result bindings (rows) one by one.
+    If the optional 'ijson' library is installed, the response is parsed while it is downloaded,
+        without ever holding the whole response in memory (handy for huge responses, e.g. big chunks of people, see 'stream').
+    These responses are not cached (neither looked up in nor added to the cache, 'force_refresh' does not apply),
+        so use 'sparql_query' for queries that may be repeated.
+
+    Parameters:
+    - query, endpoint_url, time_budget: See at 'sparql_query'.
+    - retries, delay: See at the top of the file.
+
+    Returns:
+    - generator of dict: The bindings of the response; yields nothing if unsuccessful.
+    """
+    response = _request_with_retries(query, retries, delay, endpoint_url, stream=True, time_budget=time_budget)
+    if response is None:
+        return
+    try:
+        import ijson #optional library, only used here
+    except ImportError:
+        yield from _bindings(_json_loads(response.content))
+        return
+    response.raw.decode_content = True #Let urllib3 decompress (gzip) the raw stream
+    yield from ijson.items(response.raw, 'results.bindings.item')
+
+
+def _request_with_retries(query, retries, delay, endpoint_url, stream=False, time_budget=None):
+    """
+    Send the query to the endpoint, retrying on timeouts, connection errors and temporary (server or rate limit) errors.
+    Used by 'sparql_query' and 'sparql_query_bindings'.
+
+    Returns:
+    - requests.Response or None: The successful response, None otherwise.
+    """
     if type(delay)==int:
         delay = [delay]*retries
     elif type(delay)!=list:
         raise ValueError("Delay should be an integer or a list of integers.")
-    
+
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    #The query is sent as given: the normalized form is only used as cache key, stripping lines could change
+    #multi-line string literals. The JSON format is requested by the session's Accept header, keeping URLs shorter
+    params = {'query': query}
+    use_post = len(query) > _MAX_GET_QUERY_LENGTH #E.g. the all info queries, or many people in a VALUES clause
+    rate_limiter = _rate_limiter(endpoint_url)
     for attempt in range(retries):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
         try:
-            response = requests.get(endpoint_url, params={'query': query, 'format': 'json'})
-        except urllib3.exceptions.ProtocolError as e:
-            print("Likely what happened: ProtocolError: ('Connection aborted.', RemoteDisconnected('Remote end closed connection without response'))")
-            print("Probably too big query (typically happens when querying exhibitions for many artists), try using chunks in querying instead (e.g. get_multiple_people_all_info_retry_missing).")
-            break
+            if use_post:
+                response = _SESSION.post(endpoint_url, data=params, timeout=_TIMEOUT, stream=stream)
+            else:
+                response = _SESSION.get(endpoint_url, params=params, timeout=_TIMEOUT, stream=stream)
+        except requests.exceptions.Timeout:
+            _logger.warning("Request timed out. Attempt %d of %d.", attempt + 1, retries)
+            if not _wait_before_retry(None, attempt, retries, delay, deadline):
+                break
+            continue
+        except (requests.exceptions.ConnectionError, urllib3.exceptions.ProtocolError) as e:
+            #Network blips are retried. requests wraps urllib3's ProtocolError (the server closing the connection) in a ConnectionError
+            _logger.warning("Connection error (%s). Attempt %d of %d.", e, attempt + 1, retries)
+            if "RemoteDisconnected" in str(e) or "Connection aborted" in str(e):
+                _logger.warning("Probably too big query (typically happens when querying exhibitions for many artists), try using chunks in querying instead "
+                                "(e.g. get_multiple_people_all_info_fast_retry_missing).")
+            if not _wait_before_retry(None, attempt, retries, delay, deadline):
+                break
+            continue
 
         if response.status_code == 200: #Successful
-            return response.json()
-        else: #Some status codes could be handled handled, it's fine now to only handle time based status codes
-            print(f"Error fetching data, status code: {response.status_code}.")
-            if response.status_code in [429, 500, 502, 503, 504]:
-                print(f"Attempt {attempt + 1} of {retries}.")
-                time.sleep(delay[attempt])
-            else:
-                print(f"Not retrying status code {response.status_code}.")
+            return response
+        elif response.status_code in _RETRY_STATUS_CODES:
+            _logger.warning("Error fetching data, status code: %d. Attempt %d of %d.", response.status_code, attempt + 1, retries)
+            if not _wait_before_retry(response, attempt, retries, delay, deadline, rate_limiter):
                 break
+        else:
+            _logger.warning("Error fetching data, not retrying status code %d.", response.status_code)
+            return None
     return None
 
 
+#Characters that must be escaped in a SPARQL "..." string literal
+_SPARQL_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r'})
+
+
+def _sparql_str_literal(string):
+    """
+    Make a SPARQL string literal from a (user given) string, e.g. a person's name, escaping backslashes, quotes and line breaks,
+    so names like 'Al "Scarface" Capone' do not break the query.
+
+    Parameters:
+    - string (str): The string.
+
+    Returns:
+    - str: The quoted and escaped string, e.g. '"Al \\"Scarface\\" Capone"'.
+    """
+    return '"' + string.translate(_SPARQL_ESCAPES) + '"'
+
+
 def sparql_query_by_dict(variable_names, WHERE_clause_matches, multiple_people_list = None, multiple_people_var_name = "person",
                          after_where="", label_language = False, label_language_param = "[AUTO_LANGUAGE],en" , run = True,
                          retries=3, delays=[1, 10, 60]):
@@ -95,13 +522,14 @@ def sparql_query_by_dict(variable_names, WHERE_clause_matches, multiple_people_l
 
     Returns:
     - dict or None: The JSON response of the query if successful, None otherwise.
+        It may be the cached response shared with other calls (see 'sparql_query'), do not modify it in place.
     """
     if type(variable_names) != list:
         variable_names = [variable_names]
     if type(WHERE_clause_matches) == dict:
-        print(WHERE_clause_matches)
+        _logger.debug("WHERE clause matches: %s", WHERE_clause_matches)
         WHERE_clause_matches = '\n'.join([f"{variable} {value} ." for variable, value in WHERE_clause_matches.items()])
-        print("\n",WHERE_clause_matches)
+        _logger.debug("WHERE clause:\n%s", WHERE_clause_matches)
     if type(WHERE_clause_matches) == type(None):
         WHERE_clause_matches = ""
 
@@ -114,7 +542,7 @@ def sparql_query_by_dict(variable_names, WHERE_clause_matches, multiple_people_l
         VALUES ?personLabel { "Vincent van Gogh" "Pablo Picasso" }
         ?person ?label ?personLabel.
         """
-        people_string = ' '.join(f'"{p}"' for p in multiple_people_list)
+        people_string = ' '.join(_sparql_str_literal(p) for p in multiple_people_list)
         where += f'VALUES ?{multiple_people_var_name}Label {{ {people_string} }}\n'
         where += f"?{multiple_people_var_name} ?label ?{multiple_people_var_name}Label.\n"
 
@@ -133,6 +561,40 @@ def sparql_query_by_dict(variable_names, WHERE_clause_matches, multiple_people_l
     return query
 
 
+#(flag, SELECT variables, WHERE clause) of each property that can be included in 'construct_person_query'
+_PERSON_QUERY_FIELDS = (
+    ('placeofbirth', " ?placeofbirth", "OPTIONAL { ?person wdt:P19 ?placeofbirth. }\n"),
+    ('dateofbirth', " ?dateofbirthLabel", "OPTIONAL { ?person wdt:P569 ?dateofbirth. }\n"),
+    ('dateofdeath', " ?dateofdeathLabel", "OPTIONAL { ?person wdt:P570 ?dateofdeath. }\n"),
+    ('placeofdeath', " ?placeofdeath", "OPTIONAL { ?person wdt:P20 ?placeofdeath. }\n"),
+    ('gender', " ?genderLabel", "OPTIONAL { ?person wdt:P21 ?gender. }\n"),
+    ('citizenship', " ?citizenshipLabel", "OPTIONAL { ?person wdt:P27 ?citizenship. }\n"),
+    ('occupation', " ?occupationLabel", "OPTIONAL { ?person wdt:P106 ?occupation. }\n"),
+    ('worklocation', " ?workLocationLabel ?startTime ?endTime ?pointInTime",
+     "OPTIONAL { ?person p:P937 ?workStmt.\n?workStmt ps:P937 ?workLocation.\n"
+     "                            OPTIONAL { ?workStmt pq:P580 ?startTime. }\n"
+     "                            OPTIONAL { ?workStmt pq:P582 ?endTime. }\n"
+     "                            OPTIONAL { ?workStmt pq:P585 ?pointInTime. }\n}\n"),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _person_query_template(flags):
+    """
+    Build the query of 'construct_person_query' with a %s placeholder for the person's name (as a string literal).
+    There are only 2^8 combinations of the flags, so the built templates are cached.
+
+    Parameters:
+    - flags (tuple of bool): Whether to include each property, in the order of _PERSON_QUERY_FIELDS.
+    """
+    included = [field for field, flag in zip(_PERSON_QUERY_FIELDS, flags) if flag]
+    return "".join(["SELECT ?person ?personLabel",
+                    *(select for _, select, _ in included),
+                    ' WHERE {\n?person rdfs:label|skos:altLabel %s@en.\n',
+                    *(where for _, _, where in included),
+                    "SERVICE wikibase:label { bd:serviceParam wikibase:language \"en\". }\n}"])
+
+
 def construct_person_query(person, **kwargs):
     """
     Construct a SPARQL query based on the given parameters.
@@ -144,34 +606,8 @@ def construct_person_query(person, **kwargs):
     Returns:
     - str: The constructed SPARQL query.
     """
-    properties = {'placeofbirth':'P19','dateofbirth':'P569',
-                  'dateofdeath':'P570','placeofdeath':'P20',
-                  'gender':'P21','citizenship':'P27',
-                  'occupation':'P106','worklocation':'P937'}
-    
-    query = "SELECT ?person ?personLabel"
-    for property in properties.keys():
-        if kwargs.get(property, False):
-            keyword = property
-            if property not in ['placeofbirth', 'placeofdeath',]:
-                keyword += "Label"
-            query += f" ?{keyword}"
-            if property == "worklocation":
-                query += " ?startTime ?endTime ?pointInTime"
-
-    query += " WHERE {\n" + f'?person ?label "{person}"@en.\n'
-
-    for property in properties.keys():
-        if kwargs.get(property, False):
-            if property == "worklocation":
-                query += f"OPTIONAL {{ ?person p:{properties[property]} ?workStmt.\n?workStmt ps:{properties[property]} ?workLocation.\n \
-                           OPTIONAL {{ ?workStmt pq:P580 ?startTime. }}\n \
-                           OPTIONAL {{ ?workStmt pq:P582 ?endTime. }}\n \
-                           OPTIONAL {{ ?workStmt pq:P585 ?pointInTime. }}\n}}\n"
-            else:
-                query += f"OPTIONAL {{ ?person wdt:{properties[property]} ?{property}. }}\n"
-    query += "SERVICE wikibase:label { bd:serviceParam wikibase:language \"en\". }\n}"
-    return query
+    flags = tuple(bool(kwargs.get(property, False)) for property, _, _ in _PERSON_QUERY_FIELDS)
+    return _person_query_template(flags) % _sparql_str_literal(person)
 
 
 def get_entity_label(entity_id, retries=3, lang="all", delays=[1, 10, 60], **kwargs):
@@ -191,8 +627,8 @@ def get_entity_label(entity_id, retries=3, lang="all", delays=[1, 10, 60], **kwa
             entity_id = str(entity_id)
         except:
             raise ValueError("Invalid entity_id (type).")
-    if not re.match(r'^Q\d+$', entity_id):
-        if re.match(r'\d+$', entity_id):
+    if not _QID_RE.fullmatch(entity_id):
+        if entity_id.isdecimal():
             entity_id = "Q" + entity_id
         else:
             raise ValueError("Unknown entity_id format; try either Q1234.. or the number (1234..).")
@@ -203,15 +639,15 @@ def get_entity_label(entity_id, retries=3, lang="all", delays=[1, 10, 60], **kwa
     response_json = sparql_query_by_dict(["label"], where, label_language=False,
                                          run=True, retries=retries, delays=delays)
     if response_json:
-        results = response_json.get('results', {}).get('bindings', [])
+        results = _bindings(response_json)
         if results:
             if not lang in ["all", "most", "threshold"]:
                 if len(results) > 1:
                     print(f"Multiple results for language {lang}; this is unexpected behaviour. \
                           Returning the first one.")
-                return results[0].get('label', {}).get('value', None)
+                return _value(results[0], 'label')
             else:
-                labels = [result.get('label', {}).get('value', None) for result in results]
+                labels = [_value(result, 'label') for result in results]
                 labels = [i for i in labels if i is not None]
                 if lang == "all":
                     return labels
@@ -223,6 +659,63 @@ def get_entity_label(entity_id, retries=3, lang="all", delays=[1, 10, 60], **kwa
 
 ####################################### Utility functions #######################################
 
+_EMPTY_BINDING = {} #Shared default for unbound variables, never modified
+_QID_RE = re.compile(r'Q\d+') #Wikidata entity IDs, e.g. Q5598 (use with fullmatch)
+
+
+def _value(result, key):
+    """
+    Get the value of a variable from a SPARQL result binding (one row of the results).
+    Same as result.get(key, {}).get('value', None), without creating a new empty dict for every missing variable.
+
+    Parameters:
+    - result (dict): One result binding.
+    - key (str): The variable name, e.g. 'placeOfBirthLabel'.
+
+    Returns:
+    - str or None: The value, None if the variable is not bound in this result.
+    """
+    return result.get(key, _EMPTY_BINDING).get('value')
+
+
+def _bindings(response_json):
+    """
+    Get the result bindings (rows) of a SPARQL JSON response.
+
+    Parameters:
+    - response_json (dict or None): The response, None if the query was unsuccessful.
+
+    Returns:
+    - list of dict: The bindings, empty if there are none (or no response).
+    """
+    if not response_json:
+        return []
+    return response_json.get('results', _EMPTY_BINDING).get('bindings', [])
+
+
+def _group_results(results, key, id_only=False):
+    """
+    Group the result bindings of a multi-person query by person, in one pass over the results
+    (instead of filtering all results again for every person).
+
+    Parameters:
+    - results (list of dict): The result bindings.
+    - key (str): The variable to group by, e.g. 'personLabel'.
+    - id_only (bool): Group by the last part of the value (e.g. the ID 'Q5598' of a Wikidata entity URI).
+
+    Returns:
+    - defaultdict: Dictionary of values and their list of results.
+    """
+    groups = defaultdict(list)
+    for result in results:
+        value = _value(result, key)
+        if value is not None:
+            if id_only:
+                value = value.rpartition('/')[2]
+            groups[value].append(result)
+    return groups
+
+
 def linear_thresholding(high, low = 0, rate = 1/2.5, shift=0.5):
     """
     Return the 0-1 cutoff threshold from a linear regression function.
@@ -253,9 +746,7 @@ def key_value_counts(key, results):
     Returns:
     - dict: A dictionary with the counts of each value for the key.
     """
-    values = [result.get(key, {}).get('value', None) for result in results]
-    counts = {i: values.count(i) for i in values}
-    return counts
+    return dict(Counter(_value(result, key) for result in results)) #Keeps the order of first appearance
 
 
 def most_common_results(keys, results):
@@ -324,17 +815,21 @@ def get_id_from_results(person_results):
     - results (list of dict): The results from the SPARQL query.
 
     Returns:
-    - str or None: The Wikidata ID of the person if found, None otherwise.
+    - str or None: The Wikidata ID of the person if found (the most common one), None otherwise.
     """
     if person_results:
-        ids = [result.get('person', {}).get('value', "").split('/')[-1] for result in person_results]
-        ids = [i for i in ids if re.match(r'^Q\d+$', i)]
-        id_counts = {i: ids.count(i) for i in ids}
-        most_common_id = max(id_counts, key=id_counts.get)
-        return most_common_id
+        id_counts = Counter(i for i in ((_value(result, 'person') or "").rpartition('/')[2] for result in person_results)
+                            if _QID_RE.fullmatch(i))
+        if id_counts:
+            return id_counts.most_common(1)[0][0] #On ties, the first found
     return None
 
 
+#(person_info key, result variable) of the single-valued attributes
+_SCALAR_FIELDS = (('birth_place', 'placeOfBirthLabel'), ('birth_date', 'dateOfBirth'), ('death_date', 'dateOfDeath'),
+                  ('death_place', 'placeOfDeathLabel'), ('gender', 'genderLabel'), ('citizenship', 'citizenshipLabel'))
+
+
 def create_person_info_from_results(person_name, person_results):
     """
     Create a dictionary with person information from SPARQL query results.
@@ -358,25 +853,40 @@ def create_person_info_from_results(person_name, person_results):
         'occupation': None,
         'location_dates': [],
     }
-    most_common_keys = most_common_results(['placeOfBirthLabel', 'dateOfBirth', 'dateOfDeath', 'placeOfDeathLabel',
-                                            'genderLabel', 'citizenshipLabel'], person_results)
-    person_info['birth_place'], person_info['birth_date'], person_info['death_date'] = most_common_keys[0], most_common_keys[1], most_common_keys[2]
-    person_info['death_place'], person_info['gender'], person_info['citizenship'] = most_common_keys[3], most_common_keys[4], most_common_keys[5]
+    most_common_values = most_common_results([key for _, key in _SCALAR_FIELDS], person_results)
+    for (field, _), value in zip(_SCALAR_FIELDS, most_common_values):
+        person_info[field] = value
     person_info['occupation'] = ",".join(above_threshold_counts(['occupationLabel'], person_results, threshold="linear"))
     acceptable_locations = above_threshold_counts(['workLocationLabel'], person_results, threshold="linear", rate=1/4, shift=0.49)
-    person_info['locations'] = ",".join(acceptable_locations)
+    _set_locations(person_info, person_results, acceptable_locations)
+    return person_info
+
+
+def _set_locations(person_info, person_results, locations):
+    """
+    Fill in the 'locations' and 'location_dates' of a person from the results, keeping only the given work locations.
+
+    Parameters:
+    - person_info (dict): The person's information, modified in place.
+    - person_results (list of dict): Results with 'workLocationLabel', 'startTime', 'endTime' and 'pointInTime' variables.
+    - locations (list of str): The accepted work locations, in the order they should be listed.
+    """
+    person_info['locations'] = ",".join(locations)
+    acceptable_locations = set(locations)
+    seen_locations = set() #(location, start, end, point in time) tuples, faster to look up than dicts in a list
     for result in person_results:
-        work_location = result.get('workLocationLabel', {}).get('value', None)
+        work_location = _value(result, 'workLocationLabel')
         if work_location in acceptable_locations:
-            location_info = {
-                'location': work_location,
-                'start_time': result.get('startTime', {}).get('value', None),
-                'end_time': result.get('endTime', {}).get('value', None),
-                'point_in_time': result.get('pointInTime', {}).get('value', None),
-            }
-            if location_info not in person_info['location_dates']:
-                person_info['location_dates'].append(location_info)
-    return person_info
+            location_key = (work_location, _value(result, 'startTime'),
+                            _value(result, 'endTime'), _value(result, 'pointInTime'))
+            if location_key not in seen_locations:
+                seen_locations.add(location_key)
+                person_info['location_dates'].append({
+                    'location': location_key[0],
+                    'start_time': location_key[1],
+                    'end_time': location_key[2],
+                    'point_in_time': location_key[3],
+                })
 
 
 def create_person_info_from_results_with_id(person_id, person_results):
@@ -399,6 +909,67 @@ def create_person_info_from_results_with_id(person_id, person_results):
     return person_info
 
 
+def create_full_person_info_from_results(person_name, person_results):
+    """
+    Create a dictionary with person information from SPARQL query results, keeping every value:
+    the first found value of single attributes (e.g. birth place), all occupations and all work locations.
+    Unlike 'create_person_info_from_results', no voting or thresholds are applied (used by 'get_all_person_info').
+
+    Parameters:
+    - person_name (str): The name of the person.
+    - person_results (list of dict): Results dict (from the SPARQL query), one row per person entity,
+        with the occupations and work locations concatenated (see _ALL_PERSON_INFO_QUERY).
+
+    Returns:
+    - dict: A dictionary containing the person's information.
+    """
+    person_info = {
+        'name': person_name,
+        'birth_place': None,
+        'birth_date': None,
+        'death_date': None,
+        'death_place': None,
+        'gender': None,
+        'citizenship': None,
+        'occupation': [],
+        'location_dates': [],
+    }
+    seen_occupations = set()
+    seen_locations = set() #(location, start, end, point in time) tuples, faster to look up than dicts in a list
+    missing_scalars = _SCALAR_FIELDS
+    for result in person_results:
+        if missing_scalars: #Once all single values are found, they are not looked up anymore
+            still_missing = []
+            for field, key in missing_scalars:
+                person_info[field] = _value(result, key)
+                if not person_info[field]:
+                    still_missing.append((field, key))
+            missing_scalars = still_missing
+
+        #Occupations and work locations come concatenated by the query (one row per person, see _ALL_PERSON_INFO_QUERY)
+        for occupation in (_value(result, 'occupations') or "").split(_GROUP_SEPARATOR):
+            if occupation and occupation not in seen_occupations:
+                seen_occupations.add(occupation)
+                person_info['occupation'].append(occupation)
+
+        for location_string in (_value(result, 'workLocations') or "").split(_GROUP_SEPARATOR):
+            if not location_string:
+                continue
+            location_key = tuple(value or None for value in location_string.split(_FIELD_SEPARATOR)) #Unbound times are empty strings
+            if location_key not in seen_locations:
+                seen_locations.add(location_key)
+                person_info['location_dates'].append({
+                    'location': location_key[0],
+                    'start_time': location_key[1],
+                    'end_time': location_key[2],
+                    'point_in_time': location_key[3],
+                })
+    return person_info
+
+
+_YEAR_RE = re.compile(r"\d+(?=-)") #Digits until the first dash
+
+
 def find_year(string):
     """
     Extract the year from a string.
@@ -411,8 +982,12 @@ def find_year(string):
     """
     year = None
     if string is not None:
-        year = re.findall(r"\d+(?=-)", string) #Until the first dash, match
-        year = int(year[0]) if year != [] else None
+        #Fast path for Wikidata dates, e.g. "1853-03-30T00:00:00Z" or "+1853-03-30...", no regex needed
+        start = 1 if string[:1] in ("+", "-") else 0
+        if string[start:start + 4].isdecimal() and string[start + 4:start + 5] == "-":
+            return int(string[start:start + 4])
+        year = _YEAR_RE.search(string)
+        year = int(year.group()) if year else None
     return year
 
 
@@ -428,14 +1003,14 @@ def get_years_from_response_location(response_location, silent=True):
     - list: A list of extracted years.
     """
     years = []
-    for key in ["start_time", "end_time", "point_in_time"]:
-        try:
-            year = find_year(response_location[key])
-            if year is not None:
-                years.append(year)
-        except (KeyError, IndexError):
+    for key in ("start_time", "end_time", "point_in_time"):
+        if key not in response_location:
             if not silent:
                 print(f"Could not find {key} or year in {key} for location: {response_location}")
+            continue
+        year = find_year(response_location[key])
+        if year is not None:
+            years.append(year)
     return years
 
 
@@ -448,16 +1023,18 @@ def get_places_from_response(response, silent=True, return_type = "comma_separat
     - silent (bool): Whether to print out errors or not.
     - return_type (str): Return format, can be:
         - "list": Places passed as a list
-        - "string": Places list converted to string, passed as a string
+        - "string": Places list converted to a (JSON) string, passed as a string
         - "comma_separated_string": Places list joined with commas, passed as a string
 
     Returns:
     - str: A string representation of the list of places.
     """
     places = []
+    seen_places = set()
     try:
         for place in response["location_dates"]:
-            if place["location"] not in places:
+            if place["location"] not in seen_places:
+                seen_places.add(place["location"])
                 places.append(place["location"])
             elif not silent:
                 print(f"{place['location']} already in list (person: {response['name']})")
@@ -468,7 +1045,7 @@ def get_places_from_response(response, silent=True, return_type = "comma_separat
     if return_type == "comma_separated_string":
         return ",".join(places)
     if return_type == "string":
-        return str(places)
+        return json.dumps(places, ensure_ascii=False)
     if return_type == "list":
         return places
     raise ValueError(f"Not known return_type: {return_type}")
@@ -484,7 +1061,7 @@ def get_places_with_years_from_response(response, silent=True, return_type = "li
     - silent (bool): Whether to print out errors or not.
     - return_type (str): Return format, can be:
         - "list": Places with years passed as a list
-        - "string": Places with years list converted to string, passed as a string
+        - "string": Places with years list converted to a (JSON) string, passed as a string
         - "semicolon_separated_string": Places with years list joined with semicolons between instances, passed as a string
 
     Returns:
@@ -499,24 +1076,23 @@ def get_places_with_years_from_response(response, silent=True, return_type = "li
             location_results = response['location_dates']
     else:
         location_results = response["location_dates"]
+    place_indices = {} #Location name -> index in places, to find already added locations without scanning the list
     for loc_result in location_results:
         years = get_years_from_response_location(loc_result, silent=silent)
         if years != []:
             min_year = min(years); max_year = max(years)
-            #Checking if the location is already in the list
-            if not any(p.split(':')[0] == loc_result["location"] for p in places):#Just get the part before the colon, which is the location's name
-                places.append(f"{loc_result['location']}:{min_year}-{max_year}")
+            location = loc_result["location"]
+            if location not in place_indices:
+                place_indices[location] = len(places)
+                places.append(f"{location}:{min_year}-{max_year}")
             else:
-                #Find the index of the location in the places list
-                for i, p in enumerate(places):
-                    if p.split(':')[0] == loc_result["location"]:
-                        #Add these years next to the existing years
-                        places[i] = f"{p}{dates_separator}{min_year}-{max_year}"
-                        break
+                #Add these years next to the existing years
+                i = place_indices[location]
+                places[i] = f"{places[i]}{dates_separator}{min_year}-{max_year}"
     if return_type == "semicolon_separated_string":
         return ";".join(places)
     if return_type == "string":
-        return str(places)
+        return json.dumps(places, ensure_ascii=False)
     if return_type == "list":
         return places
     raise ValueError(f"Not known return_type: {return_type}")
@@ -525,6 +1101,8 @@ def get_places_with_years_from_response(response, silent=True, return_type = "li
 def stringlist_to_list(stringlist):
     """
     Convert a string representation of a list to an actual list.
+    Lists are stored as JSON strings by this module, but Python-style strings (e.g. "['Paris', 'Arles']",
+        as saved by earlier versions) are accepted too.
 
     Parameters:
     - stringlist (str): The string representation of a list.
@@ -532,8 +1110,10 @@ def stringlist_to_list(stringlist):
     Returns:
     - list: The converted list.
     """
-    import ast #library not used for other cases, not worth importing generally
-    return ast.literal_eval(stringlist) #but this functionality is already included in it
+    try:
+        return json.loads(stringlist) #Much faster than parsing Python syntax
+    except ValueError:
+        return ast.literal_eval(stringlist) #Old, Python-style strings
 
 
 def results_dataframe(all_people_info: list | dict):
@@ -556,83 +1136,252 @@ def results_dataframe(all_people_info: list | dict):
 
 ####################################### Queries for multiple instances (people) #######################################
 
-def get_multiple_people_all_info(people, retries=3, delays=[1, 10, 60]):
+def _run_in_threads(function, items, max_workers=4):
+    """
+    Call a (network bound) function on each item in parallel threads, sharing the session's kept-alive connections.
+
+    Returns:
+    - list: The return values, in the same order as the items.
+    """
+    if len(items) <= 1:
+        return [function(item) for item in items] #No need for threads
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(function, items))
+
+
+def _chunk_results(query, retries, delays, stream=False):
+    """
+    Run the query of one chunk and return its result bindings (empty if the query was unsuccessful).
+    With stream=True, the bindings are parsed while the response is downloaded ('sparql_query_bindings', not cached),
+        so the whole response is never held in memory at once.
+    """
+    if stream:
+        return sparql_query_bindings(query, retries, delays)
+    return _bindings(sparql_query(query, retries, delays))
+
+
+def _run_queries(queries, retries, delays, max_workers=4):
+    """
+    Run independent (chunk) queries with 'sparql_query' in parallel threads.
+
+    Returns:
+    - list: The JSON responses (or None for failed queries), in the same order as the queries.
+    """
+    return _run_in_threads(lambda query: sparql_query(query, retries, delays), queries, max_workers)
+
+
+#Queries of the multi-person functions, one per chunk: {values} is replaced by the names (or IDs) of the chunk (see _build_multi_query)
+_MULTI_PERSON_QUERY_TMPL = '''
+    SELECT ?person ?personLabel ?placeOfBirthLabel ?dateOfBirth ?dateOfDeath ?placeOfDeathLabel ?workLocationLabel ?startTime ?endTime ?pointInTime ?genderLabel ?citizenshipLabel ?occupationLabel WHERE {{
+      VALUES ?personLabel {{ {values} }}
+      ?person ?label ?personLabel.
+      ?person wdt:P31 wd:Q5.  #Ensure it's an instance of human, could happen that it's a statue of the person or something
+{life_data}
+      OPTIONAL {{ ?person wdt:P21 ?gender. }}
+      OPTIONAL {{ ?person wdt:P27 ?citizenship. }}
+      OPTIONAL {{ ?person wdt:P106 ?occupation. }}
+      OPTIONAL {{
+        ?person p:P937 ?workStmt.
+        ?workStmt ps:P937 ?workLocation.
+        OPTIONAL {{ ?workStmt pq:P580 ?startTime. }}
+        OPTIONAL {{ ?workStmt pq:P582 ?endTime. }}
+        OPTIONAL {{ ?workStmt pq:P585 ?pointInTime. }}
+      }}
+      SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
+    }}
+    '''
+#Strict queries only find people with known birth and death places and dates, relaxed ones find anyone (missing values are None)
+_MULTI_PERSON_LIFE_DATA = {
+    True: '''      ?person wdt:P19 ?placeOfBirth.
+      ?person wdt:P569 ?dateOfBirth.
+      ?person wdt:P570 ?dateOfDeath.
+      ?person wdt:P20 ?placeOfDeath.''',
+    False: '''      OPTIONAL { ?person wdt:P19 ?placeOfBirth. }
+      OPTIONAL { ?person wdt:P569 ?dateOfBirth. }
+      OPTIONAL { ?person wdt:P570 ?dateOfDeath. }
+      OPTIONAL { ?person wdt:P20 ?placeOfDeath. }''',
+}
+
+_MULTI_PERSON_BY_ID_QUERY_TMPL = '''
+    SELECT ?person ?personLabel ?placeOfBirthLabel ?dateOfBirth ?dateOfDeath ?placeOfDeathLabel ?workLocationLabel ?startTime ?endTime ?pointInTime ?genderLabel ?citizenshipLabel ?occupationLabel WHERE {{
+      VALUES ?person {{ {values} }}
+      ?person wdt:P31 wd:Q5.  #Ensure it's an instance of human, could happen that it's a statue of the person or something
+      ?person wdt:P19 ?placeOfBirth.
+      ?person wdt:P569 ?dateOfBirth.
+      ?person wdt:P570 ?dateOfDeath.
+      ?person wdt:P20 ?placeOfDeath.
+      OPTIONAL {{ ?person wdt:P21 ?gender. }}
+      OPTIONAL {{ ?person wdt:P27 ?citizenship. }}
+      OPTIONAL {{ ?person wdt:P106 ?occupation. }}
+      OPTIONAL {{
+        ?person p:P937 ?workStmt.
+        ?workStmt ps:P937 ?workLocation.
+        OPTIONAL {{ ?workStmt pq:P580 ?startTime. }}
+        OPTIONAL {{ ?workStmt pq:P582 ?endTime. }}
+        OPTIONAL {{ ?workStmt pq:P585 ?pointInTime. }}
+      }}
+      SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
+    }}
+    '''
+
+#No label service: ?personLabel is bound to the given names by VALUES, and only the IDs are needed
+_MULTI_PERSON_IDS_QUERY_TMPL = '''
+    SELECT ?person ?personLabel WHERE {{
+      VALUES ?personLabel {{ {values} }}
+      ?person ?label ?personLabel.
+      ?person wdt:P31 wd:Q5.  #Ensure instances of humans
+    }}
+    '''
+
+
+def _build_multi_query(people, strict=True):
+    """
+    Build the query of 'get_multiple_people_all_info' for a chunk of people.
+
+    Parameters:
+    - people (list of str): Names of the people in the chunk.
+    - strict (bool): Whether to require birth and death places and dates (see _MULTI_PERSON_LIFE_DATA).
+
+    Returns:
+    - str: The query.
+    """
+    people_string = ' '.join(_sparql_str_literal(p) for p in people)
+    return _MULTI_PERSON_QUERY_TMPL.format(values=people_string, life_data=_MULTI_PERSON_LIFE_DATA[strict])
+
+
+def get_multiple_people_all_info(people, retries=3, delays=[1, 10, 60], chunk_size=150, max_workers=4, stream=False, strict=True):
     """
     NOTE: Querying multiple people at once is faster than querying them separately, however might miss some instances.
     Definitely consider using 'get_multiple_people_all_info_fast_retry_missing' which runs this function and tries again for missing instances.
 
-    Get all information about multiple people from Wikidata, in one query per chunk (150 instances).
+    Get all information about multiple people from Wikidata, in one query per chunk (150 instances by default).
 
     Parameters:
-    - people, retries, delays: See at the top of the file.
+    - people, retries, delays, chunk_size, max_workers: See at the top of the file.
+    - stream (bool): Parse the responses while downloading them, grouping the rows by person on the fly,
+        instead of loading each whole response first (less memory for big chunks, but the responses are not cached).
+    - strict (bool): Only find people whose birth and death places and dates are all known (default).
+        If False, these are optional, so more people are found, with None for the missing values.
 
     Returns:
     - list: List of dictionaries for each person.
     """
     #Reduce the number of people in one query, one query per chunk
-    chunks = [people[i:i + 150] for i in range(0, len(people), 150)]
-    all_people_info = []
-    for chunk in chunks:
-        people_string = ' '.join(f'"{p}"' for p in chunk)
-        query = f'''
-        SELECT ?person ?personLabel ?placeOfBirthLabel ?dateOfBirth ?dateOfDeath ?placeOfDeathLabel ?workLocationLabel ?startTime ?endTime ?pointInTime ?genderLabel ?citizenshipLabel ?occupationLabel WHERE {{
-          VALUES ?personLabel {{ {people_string} }}
-          ?person ?label ?personLabel.
-          ?person wdt:P31 wd:Q5.  #Ensure it's an instance of human, could happen that it's a statue of the person or something
-          ?person wdt:P19 ?placeOfBirth.
-          ?person wdt:P569 ?dateOfBirth.
-          ?person wdt:P570 ?dateOfDeath.
-          ?person wdt:P20 ?placeOfDeath.
-          OPTIONAL {{ ?person wdt:P21 ?gender. }}
-          OPTIONAL {{ ?person wdt:P27 ?citizenship. }}
-          OPTIONAL {{ ?person wdt:P106 ?occupation. }}
-          OPTIONAL {{
-            ?person p:P937 ?workStmt.
-            ?workStmt ps:P937 ?workLocation.
-            OPTIONAL {{ ?workStmt pq:P580 ?startTime. }}
-            OPTIONAL {{ ?workStmt pq:P582 ?endTime. }}
-            OPTIONAL {{ ?workStmt pq:P585 ?pointInTime. }}
-          }}
-          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
-        }}
-        '''
-        response_json = sparql_query(query, retries, delays)
-        results = response_json.get('results', {}).get('bindings', [])
+    chunks = [people[i:i + chunk_size] for i in range(0, len(people), chunk_size)]
+
+    def chunk_people_info(chunk):
+        #Runs in a worker thread: only this chunk's results are kept, until the person dicts are made
+        query = _build_multi_query(chunk, strict)
+        results_by_person = _group_results(_chunk_results(query, retries, delays, stream), 'personLabel')
+        people_info = []
         for person_name in chunk:
-            person_results = [r for r in results if r.get('personLabel', {}).get('value') == person_name]
+            person_results = results_by_person.get(person_name)
             if person_results:
                 person_info = create_person_info_from_results(person_name, person_results)
                 person_info['id'] = get_id_from_results(person_results)
-                all_people_info.append(person_info)
+                people_info.append(person_info)
+        return people_info
+
+    all_people_info = []
+    for people_info in _run_in_threads(chunk_people_info, chunks, max_workers):
+        all_people_info.extend(people_info)
+    return all_people_info
+
+
+#Query of 'get_all_people_info_batch' (and of 'get_all_person_info_strict', with one name):
+#{values} is replaced by the names as "name"@en literals, matched as English labels or aliases
+_ALL_PEOPLE_INFO_BATCH_QUERY_TMPL = '''
+    SELECT ?name ?person ?personLabel ?placeOfBirthLabel ?dateOfBirth ?dateOfDeath ?placeOfDeathLabel ?workLocationLabel ?startTime ?endTime ?pointInTime ?genderLabel ?citizenshipLabel ?occupationLabel WHERE {{
+      VALUES ?name {{ {values} }}
+      ?person rdfs:label|skos:altLabel ?name.
+      ?person wdt:P31 wd:Q5.
+      OPTIONAL {{?person wdt:P19 ?placeOfBirth. }}
+      OPTIONAL {{?person wdt:P569 ?dateOfBirth. }}
+      OPTIONAL {{?person wdt:P570 ?dateOfDeath. }}
+      OPTIONAL {{?person wdt:P20 ?placeOfDeath. }}
+      OPTIONAL {{ ?person wdt:P21 ?gender. }}
+      OPTIONAL {{ ?person wdt:P27 ?citizenship. }}
+      OPTIONAL {{ ?person wdt:P106 ?occupation. }}
+      OPTIONAL {{
+        ?person p:P937 ?workStmt.
+        ?workStmt ps:P937 ?workLocation.
+        OPTIONAL {{ ?workStmt pq:P580 ?startTime. }}
+        OPTIONAL {{ ?workStmt pq:P582 ?endTime. }}
+        OPTIONAL {{ ?workStmt pq:P585 ?pointInTime. }}
+      }}
+      SERVICE wikibase:label {{ bd:serviceParam wikibase:language "[AUTO_LANGUAGE],en". }}
+    }}
+    '''
+
+
+def get_all_people_info_batch(people, retries=3, delays=[1, 10, 60], chunk_size=50, max_workers=4):
+    """
+    Get all information about multiple people (and their IDs) from Wikidata, with one query per chunk of people
+    (50 by default) instead of one query per person ('get_all_person_info_strict' is this function for one person).
+    The people of a failed chunk query (e.g. timed out) are queried one by one, with the same retries and delays.
+    Unlike 'get_multiple_people_all_info', the names are matched as English labels (like in the single-person queries),
+        and birth and death data are not required.
+
+    Parameters:
+    - people, retries, delays, chunk_size, max_workers: See at the top of the file.
+
+    Returns:
+    - list: List of dictionaries for each person found (with a valid ID).
+    """
+    chunks = [people[i:i + chunk_size] for i in range(0, len(people), chunk_size)]
+    queries = [_ALL_PEOPLE_INFO_BATCH_QUERY_TMPL.format(values=' '.join(f'{_sparql_str_literal(p)}@en' for p in chunk)) for chunk in chunks]
+
+    all_people_info = []
+    failed_people = []
+    for chunk, response_json in zip(chunks, _run_queries(queries, retries, delays, max_workers)):
+        if response_json is None and len(chunk) > 1: #E.g. the chunk timed out: its people are queried one by one below
+            failed_people.extend(chunk)
+            continue
+        results_by_person = _group_results(_bindings(response_json), 'name')
+        for person_name in chunk:
+            person_results = results_by_person.get(person_name)
+            if person_results:
+                id = get_id_from_results(person_results) #Only instances with a valid (Q...) ID are kept
+                if id:
+                    person_info = create_person_info_from_results(person_name, person_results)
+                    person_info['id'] = id
+                    all_people_info.append(person_info)
+
+    if failed_people:
+        all_people_info += get_all_people_info_batch(failed_people, retries, delays, chunk_size=1, max_workers=max_workers)
     return all_people_info
 
 
-def get_multiple_people_all_info_fast_retry_missing(people, retries=3, delays=[1,10,60]):
+def get_multiple_people_all_info_fast_retry_missing(people, retries=3, delays=[1,10,60], max_workers=4):
     """
-    Quickly query multiple people at once, then retry for missing instances separately.
-    Basically, running 'get_multiple_people_all_info' first, then 'get_all_person_info_strict' for each missing instance separately.
+    Quickly query multiple people at once, then retry for missing instances.
+    Basically, running 'get_multiple_people_all_info' first, then again for the missing instances with strict=False
+        (still in chunks, without requiring birth and death data), and finally 'get_all_people_info_batch'
+        (the query of 'get_all_person_info_strict', for many people at once) for the still missing instances.
         If there are still missing instances, run 'get_person_all_info_different_languages' to check if they have an instance in non-English Wikipedia.
 
     Parameters:
-    - people, retries, delay: See at the top of the file.
+    - people, retries, delay, max_workers: See at the top of the file.
 
     Returns:
     - list: List of dictionaries for each person.
     """
-    gathered_people_parallel = get_multiple_people_all_info(people, retries, delays)
-    collected_names = [gathered_people_parallel[k]['name'] for k in range(len(gathered_people_parallel))]
+    gathered_people_parallel = get_multiple_people_all_info(people, retries, delays, max_workers=max_workers)
+    collected_names = {person_info['name'] for person_info in gathered_people_parallel}
     missing_people = [p for p in people if p not in collected_names]
 
-    gathered_people_separate = []
-    for person in missing_people:
-        person_info = get_all_person_info_strict(person)
-        if person_info:
-            gathered_people_separate.append(person_info)
+    if missing_people: #Most are missed because of the required birth/death data: one relaxed query per chunk instead of one query per person
+        gathered_people_relaxed = get_multiple_people_all_info(missing_people, retries, delays, max_workers=max_workers, strict=False)
+        gathered_people_parallel += gathered_people_relaxed
+        collected_names.update(person_info['name'] for person_info in gathered_people_relaxed)
+        missing_people = [p for p in missing_people if p not in collected_names]
+
+    gathered_people_separate = get_all_people_info_batch(missing_people, retries, delays, max_workers=max_workers)
     
     return gathered_people_parallel + gathered_people_separate
 
 
-def get_multiple_people_all_info_separate_responses(people, retries=3, delay=60):
+def get_multiple_people_all_info_separate_responses(people, retries=3, delay=60, chunk_size=150, max_workers=4):
     """
     NOTE: Only use this if you want to handle the responses separately.
     Otherwise, consider using 'get_multiple_people_all_info_fast_retry_missing' or 'get_multiple_people_all_info'.
@@ -640,50 +1389,28 @@ def get_multiple_people_all_info_separate_responses(people, retries=3, delay=60)
     Get all information about multiple people from Wikidata.
 
     Parameters:
-    - people, retries, delay: See at the top of the file.
+    - people, retries, delay, chunk_size, max_workers: See at the top of the file.
 
     Returns:
-    - list: List of responses (dictionaries) for each person.
+    - list: List of responses (dictionaries) for each chunk.
     """
     #First, reduce the number of people in one query
-    chunks = [people[i:i + 150] for i in range(0, len(people), 150)]
-    responses = []
+    chunks = [people[i:i + chunk_size] for i in range(0, len(people), chunk_size)]
+    queries = []
     for chunk in chunks:
-        people_string = ' '.join(f'"{p}"' for p in chunk)
-        query = f'''
-        SELECT ?person ?personLabel ?placeOfBirthLabel ?dateOfBirth ?dateOfDeath ?placeOfDeathLabel ?workLocationLabel ?startTime ?endTime ?pointInTime ?genderLabel ?citizenshipLabel ?occupationLabel WHERE {{
-          VALUES ?personLabel {{ {people_string} }}
-          ?person ?label ?personLabel.
-          ?person wdt:P31 wd:Q5.  #Ensure it's an instance of human, could happen that it's a statue of the person or something
-          ?person wdt:P19 ?placeOfBirth.
-          ?person wdt:P569 ?dateOfBirth.
-          ?person wdt:P570 ?dateOfDeath.
-          ?person wdt:P20 ?placeOfDeath.
-          OPTIONAL {{ ?person wdt:P21 ?gender. }}
-          OPTIONAL {{ ?person wdt:P27 ?citizenship. }}
-          OPTIONAL {{ ?person wdt:P106 ?occupation. }}
-          OPTIONAL {{
-            ?person p:P937 ?workStmt.
-            ?workStmt ps:P937 ?workLocation.
-            OPTIONAL {{ ?workStmt pq:P580 ?startTime. }}
-            OPTIONAL {{ ?workStmt pq:P582 ?endTime. }}
-            OPTIONAL {{ ?workStmt pq:P585 ?pointInTime. }}
-          }}
-          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
-        }}
-        '''
-        response_json = sparql_query(query, retries, delay)
-        responses.append(response_json)
-    return responses
-
-
-def get_multiple_people_wikidata_ids(people, retries=3, delays = [1, 10, 60], return_counts=False, return_extended=False, return_most_common=False):
+        queries.append(_build_multi_query(chunk))
+    return _run_queries(queries, retries, delay, max_workers)
+
+
+def get_multiple_people_wikidata_ids(people, retries=3, delays = [1, 10, 60], return_counts=False, return_extended=False, return_most_common=False,
+                                     chunk_size=500, max_workers=4):
     """
     Retrieve (only) Wikidata IDs for multiple people.
     This is useful to further query information afterwards, using the IDs (which get faster responses).
 
     Parameters:
-    - people, retries, delays: See at the top of the file.
+    - people, retries, delays, chunk_size, max_workers: See at the top of the file.
+        The ID query is light, so the chunks are bigger (500 people by default), the long queries are sent with POST.
     - return_counts (bool): Whether to return the counts of response results for each person.
     - return_extended (bool): Whether to return the extended results (all IDs) for each person, or just the last one, or...
     - return_most_common (bool): Return the most common ID gathered for each person.
@@ -695,41 +1422,35 @@ def get_multiple_people_wikidata_ids(people, retries=3, delays = [1, 10, 60], re
     Warning:
     - If return_most_common and return_extended are both True, only return_extended will be used.
     """
-    from collections import Counter
     if return_most_common and return_extended:
         print("Both return_most_common and return_extended are True. Only return_extended will be used.")
 
-    chunks = [people[i:i + 150] for i in range(0, len(people), 150)]
+    chunks = [people[i:i + chunk_size] for i in range(0, len(people), chunk_size)]
     all_wikidata_ids = {}
     result_counts = {}
     extended_results = {}
 
+    queries = []
     for chunk in chunks:
-        people_string = ' '.join(f'"{p}"' for p in chunk)
-        query = f'''
-        SELECT ?person ?personLabel WHERE {{
-          VALUES ?personLabel {{ {people_string} }}
-          ?person ?label ?personLabel.
-          ?person wdt:P31 wd:Q5.
-          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "[AUTO_LANGUAGE],*". }}
-        }}
-        ''' #?person wdt:P31 wd:Q5. : Ensure instances of humans
-
-        response_json = sparql_query(query, retries, delays)
+        people_string = ' '.join(_sparql_str_literal(p) for p in chunk)
+        query = _MULTI_PERSON_IDS_QUERY_TMPL.format(values=people_string)
+        queries.append(query)
+
+    for chunk, response_json in zip(chunks, _run_queries(queries, retries, delays, max_workers)):
         if response_json:
-            results = response_json.get('results', {}).get('bindings', [])
+            results_by_person = _group_results(_bindings(response_json), 'personLabel')
             for person_name in chunk:
-                person_results = [r for r in results if r.get('personLabel', {}).get('value') == person_name]
+                person_results = results_by_person.get(person_name, [])
                 result_counts[person_name] = len(person_results)
                 if person_results:
                     if return_extended or return_most_common:
-                        extended_results[person_name] = [r.get('person', {}).get('value').split('/')[-1]
-                                                         for r in person_results if 'entity/Q' in r.get('person', {}).get('value')]
+                        extended_results[person_name] = [_value(r, 'person').rpartition('/')[2]
+                                                         for r in person_results if 'entity/Q' in _value(r, 'person')]
                     else:
                         for result in person_results:
-                            person = result.get('person', {}).get('value', None)
+                            person = _value(result, 'person')
                             if person and 'entity/Q' in person:
-                                wikidata_id = person.split('/')[-1]
+                                wikidata_id = person.rpartition('/')[2]
                                 all_wikidata_ids[person_name] = wikidata_id
                                 break
 
@@ -754,122 +1475,243 @@ def get_multiple_people_wikidata_ids(people, retries=3, delays = [1, 10, 60], re
         return all_wikidata_ids
 
 
-def get_multiple_people_wikidata_ids_retry_missing(people, retries=3, delays = [1, 10, 60]):
+def get_multiple_people_wikidata_ids_retry_missing(people, retries=3, delays = [1, 10, 60], max_workers=4):
     """
-    Gather Wikidata IDs for multiple people in one query, then retry missing instances with separate queries.
+    Gather Wikidata IDs for multiple people in one query, then retry missing instances with separate (parallel) queries.
 
     Parameters:
-    - people, retries, delays: See at the top of the file.
+    - people, retries, delays, max_workers: See at the top of the file.
 
     Returns:
     - dict: Dictionary of person names and their Wikidata IDs.
     """
-    gathered_ids_parallel = get_multiple_people_wikidata_ids(people, retries, delays, return_counts=False, return_extended=False, return_most_common=True)
-    collected_names = list(gathered_ids_parallel.keys())
-    missing_people = [p for p in people if p not in collected_names]
+    gathered_ids_parallel = get_multiple_people_wikidata_ids(people, retries, delays, return_counts=False, return_extended=False, return_most_common=True,
+                                                             max_workers=max_workers)
+    missing_people = [p for p in people if p not in gathered_ids_parallel] #dict lookup, not a list scan
 
     gathered_ids_separate = {}
-    for person in missing_people:
-        person_id = get_person_wikidata_id(person)
+    person_ids = _run_in_threads(lambda person: get_person_wikidata_id(person, retries, delays), missing_people, max_workers)
+    for person, person_id in zip(missing_people, person_ids):
         if person_id:
             gathered_ids_separate[person] = person_id
     return {**gathered_ids_parallel, **gathered_ids_separate} #concatenated
 
 
-def get_multiple_people_all_info_by_id(people_ids, retries=3, delay=60):
+def get_multiple_people_all_info_by_id(people_ids, retries=3, delay=60, chunk_size=150, max_workers=4, stream=False):
     """
     Get all information about multiple people from Wikidata by their IDs.
 
     Parameters:
     - people_ids (list of str): List of Wikidata IDs of the people.
-    - retries, delay: See at the top of the file.
+    - retries, delay, chunk_size, max_workers: See at the top of the file.
+    - stream (bool): See at 'get_multiple_people_all_info'.
 
     Returns:
     - list: List of dictionaries for each person.
     """
     # First, reduce the number of people in one query
-    chunks = [people_ids[i:i + 150] for i in range(0, len(people_ids), 150)]
-    all_people_info = []
-    for chunk in chunks:
+    chunks = [people_ids[i:i + chunk_size] for i in range(0, len(people_ids), chunk_size)]
+
+    def chunk_people_info(chunk):
         people_id_string = ' '.join(f'wd:{id}' for id in chunk)
-        query = f'''
-        SELECT ?person ?personLabel ?name ?placeOfBirthLabel ?dateOfBirth ?dateOfDeath ?placeOfDeathLabel ?workLocationLabel ?startTime ?endTime ?pointInTime ?genderLabel ?citizenshipLabel ?occupationLabel WHERE {{
-          VALUES ?person {{ {people_id_string} }}
-          ?person wdt:P31 wd:Q5.  #Ensure it's an instance of human, could happen that it's a statue of the person or something
-          ?person wdt:P19 ?placeOfBirth.
-          ?person wdt:P569 ?dateOfBirth.
-          ?person wdt:P570 ?dateOfDeath.
-          ?person wdt:P20 ?placeOfDeath.
-          OPTIONAL {{ ?person wdt:P21 ?gender. }}
-          OPTIONAL {{ ?person wdt:P27 ?citizenship. }}
-          OPTIONAL {{ ?person wdt:P106 ?occupation. }}
-          OPTIONAL {{
-            ?person p:P937 ?workStmt.
-            ?workStmt ps:P937 ?workLocation.
-            OPTIONAL {{ ?workStmt pq:P580 ?startTime. }}
-            OPTIONAL {{ ?workStmt pq:P582 ?endTime. }}
-            OPTIONAL {{ ?workStmt pq:P585 ?pointInTime. }}
-          }}
-          OPTIONAL {{ ?person rdfs:label ?name. FILTER(LANG(?name) = "en") }}
-          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
-        }}
-        '''
-        response_json = sparql_query(query, retries, delay)
-        results = response_json.get('results', {}).get('bindings', [])
+        query = _MULTI_PERSON_BY_ID_QUERY_TMPL.format(values=people_id_string)
+        results_by_person = _group_results(_chunk_results(query, retries, delay, stream), 'person', id_only=True)
+        people_info = []
         for person_id in chunk:
-            person_results = [r for r in results if r.get('person', {}).get('value').split('/')[-1] == person_id]
+            person_results = results_by_person.get(person_id)
             if person_results:
-                person_info = create_person_info_from_results_with_id(person_id, person_results)
-                all_people_info.append(person_info)
+                people_info.append(create_person_info_from_results_with_id(person_id, person_results))
+        return people_info
+
+    all_people_info = []
+    for people_info in _run_in_threads(chunk_people_info, chunks, max_workers):
+        all_people_info.extend(people_info)
     return all_people_info
 
 
-def get_multiple_people_all_info_by_id_fast_retry_missing(people_ids, retries=3, delay=60):
+def get_multiple_people_all_info_by_id_fast_retry_missing(people_ids, retries=3, delay=60, max_workers=4):
     """
     NOTE: Unlike 'get_multiple_people_all_info_fast_retry_missing', here there is no attempt to look for non-English Wikipedia instances.
 
-    Get all information about multiple people from Wikidata by their IDs, with retry for missing instances.
+    Get all information about multiple people from Wikidata by their IDs, with (parallel) retries for missing instances.
 
     Parameters:
     - people_ids (list of str): List of Wikidata IDs of the people.
-    - retries, delay: See at the top of the file.
+    - retries, delay, max_workers: See at the top of the file.
 
     Returns:
     - list: List of dictionaries for each person.
     """
-    gathered_people_parallel = get_multiple_people_all_info_by_id(people_ids, retries, delay)
-    collected_ids = [gathered_people_parallel[k]['id'] for k in range(len(gathered_people_parallel))]
+    gathered_people_parallel = get_multiple_people_all_info_by_id(people_ids, retries, delay, max_workers=max_workers)
+    collected_ids = {person_info['id'] for person_info in gathered_people_parallel}
     missing_people_ids = [id for id in people_ids if id not in collected_ids]
 
-    gathered_people_separate= []
-    for person_id in missing_people_ids:
-        person_info = get_all_person_info_by_id(person_id)
-        if person_info:
-            gathered_people_separate.append(person_info)
+    gathered_people_separate = get_all_people_info_by_ids(missing_people_ids, retries, delay, max_workers=max_workers)
 
     return gathered_people_parallel + gathered_people_separate
 
 
+def get_all_people_info_by_ids(people_ids, retries=3, delays=[1, 10, 60], chunk_size=50, max_workers=4):
+    """
+    Same as calling 'get_all_person_info_by_id' for each ID, but with one query pair (information, work locations)
+    per chunk of IDs (50 by default), instead of one pair per person.
+    Unlike 'get_multiple_people_all_info_by_id', birth and death data are not required.
+    The people of a failed chunk (e.g. timed out) are queried one by one, with the same retries and delays.
+
+    Parameters:
+    - people_ids (list of str): List of Wikidata IDs of the people.
+    - retries, delays, chunk_size, max_workers: See at the top of the file.
+
+    Returns:
+    - list: List of dictionaries for each person found.
+    """
+    chunks = [people_ids[i:i + chunk_size] for i in range(0, len(people_ids), chunk_size)]
+    queries = [query for chunk in chunks for query in _person_info_by_id_queries(chunk)]
+    responses = _run_queries(queries, retries, delays, max_workers)
+
+    all_people_info = []
+    failed_people_ids = []
+    for chunk, info_json, locations_json in zip(chunks, responses[0::2], responses[1::2]):
+        if (info_json is None or locations_json is None) and len(chunk) > 1: #Queried one by one below
+            failed_people_ids.extend(chunk)
+            continue
+        results_by_person = _group_results(_bindings(info_json), 'person', id_only=True)
+        locations_by_person = _group_results(_bindings(locations_json), 'person', id_only=True)
+        for person_id in chunk:
+            person_results = results_by_person.get(person_id)
+            location_results = locations_by_person.get(person_id)
+            if person_results and location_results:
+                all_people_info.append(create_person_info_from_results_by_id(person_id, person_results, location_results))
+
+    if failed_people_ids:
+        all_people_info += get_all_people_info_by_ids(failed_people_ids, retries, delays, chunk_size=1, max_workers=max_workers)
+    return all_people_info
+
+
+async def _run_with_semaphore(semaphore, function, *args, **kwargs):
+    """
+    Run a blocking (query) function in a worker thread, once the semaphore lets it through.
+    """
+    async with semaphore:
+        return await asyncio.to_thread(function, *args, **kwargs)
+
+
+async def map_people_async(function, people, concurrency=10, **kwargs):
+    """
+    Run a single-person query function (e.g. 'get_person_wikidata_id', 'get_person_locations') for each person,
+    with up to 'concurrency' queries running at the same time instead of one after another.
+
+    Usage: in a Jupyter Notebook, 'await map_people_async(get_person_wikidata_id, people)',
+        in a script, 'asyncio.run(map_people_async(get_person_wikidata_id, people))'.
+
+    Parameters:
+    - function (callable): The function, called as function(person, **kwargs).
+    - people: See at the top of the file (can be Wikidata IDs too, for the '..._by_id' functions).
+    - concurrency (int): Maximum number of queries running at the same time. Wikidata throttles many parallel queries,
+        so keep this low (about 10 at most).
+    - kwargs: Passed to the function (e.g. retries, delays).
+
+    Returns:
+    - list: The return values, in the order of 'people'.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(*[_run_with_semaphore(semaphore, function, person, **kwargs) for person in people])
+
+
+async def get_multiple_people_all_info_async(people, concurrency=10, retries=3, delays=[1, 10, 60]):
+    """
+    Get all information about multiple people from Wikidata, one query per person ('get_all_person_info_strict'),
+    but with up to 'concurrency' queries running at the same time instead of one after another.
+    Waiting for retries does not block the other queries.
+
+    Usage: in a Jupyter Notebook, 'await get_multiple_people_all_info_async(people)',
+        in a script, 'asyncio.run(get_multiple_people_all_info_async(people))'.
+
+    Parameters:
+    - people, retries, delays: See at the top of the file.
+    - concurrency (int): Maximum number of queries running at the same time. Wikidata throttles many parallel queries,
+        so keep this low (about 10 at most).
+
+    Returns:
+    - list: List of dictionaries for each person found, in the order of 'people'.
+    """
+    responses = await map_people_async(get_all_person_info_strict, people, concurrency, retries=retries, delays=delays)
+    return [response for response in responses if response]
+
+
+async def get_multiple_people_wikidata_ids_async(people, concurrency=10, retries=3, delays=[1, 10, 60]):
+    """
+    Get the Wikidata IDs of multiple people, one query per person ('get_person_wikidata_id'), running concurrently.
+    See 'get_multiple_people_all_info_async' for usage.
+
+    Parameters:
+    - people, retries, delays: See at the top of the file.
+    - concurrency (int): See at 'map_people_async'.
+
+    Returns:
+    - dict: Dictionary of person names and their Wikidata IDs (only the people found).
+    """
+    ids = await map_people_async(get_person_wikidata_id, people, concurrency, retries=retries, delays=delays)
+    return {person: id for person, id in zip(people, ids) if id}
+
+
+async def get_multiple_people_exhibitions_by_id_async(people_ids, concurrency=10, retries=3, delays=[1, 10, 60]):
+    """
+    Get the exhibitions (collections) of multiple people by their Wikidata IDs ('get_exhibitions_by_id'), running concurrently.
+    These queries are slow for prolific artists, so running them at the same time saves the most time.
+    See 'get_multiple_people_all_info_async' for usage.
+
+    Parameters:
+    - people_ids (list of str): List of Wikidata IDs of the people.
+    - retries, delays: See at the top of the file.
+    - concurrency (int): See at 'map_people_async'.
+
+    Returns:
+    - dict: Dictionary of IDs and their list of exhibitions (only for successful queries).
+    """
+    exhibitions = await map_people_async(get_exhibitions_by_id, people_ids, concurrency, retries=retries, delays=delays)
+    return {person_id: collections for person_id, collections in zip(people_ids, exhibitions) if collections is not None}
+
 ####################################### Queries for 1 person #######################################
 #(SPARQL queries). Exhibitions: see below at "queries by Wikidata ID"
+#People are matched by their English label or alias ("?person rdfs:label|skos:altLabel ..."), which the endpoint looks up
+#in its label index, instead of "?person ?label ...", which checks every property with the name as a value.
 
-def get_all_person_info(person_name, retries=3, delays = [1, 10, 60]):
+def _query_person_results(query_template, person_name, retries, delays):
     """
-    Default function to get all sorts of information about a person from Wikidata.
-    This includes the person's name, birth place, birth date, death date, gender, citizenship, occupation, work locations (with time data).
+    Put the person's name into a single-person query template, run the query and return its result bindings.
+    All single-person queries by name go through here.
 
     Parameters:
+    - query_template (str): Query with a %s placeholder for the name (it is put in as an escaped string literal).
     - person_name, retries, delays: See at the top of the file.
 
     Returns:
-    - dict or None: Data dictionary about the person if successful, None otherwise.
+    - list of dict or None: The bindings (rows) of the response (can be empty), None if the query was unsuccessful.
     """
-    query = '''
-    SELECT ?person ?personLabel ?placeOfBirthLabel ?dateOfBirth ?dateOfDeath ?placeOfDeathLabel ?workLocationLabel ?startTime ?endTime ?pointInTime ?genderLabel ?citizenshipLabel ?occupationLabel WHERE {
-      ?person ?label "%s"@en.
+    query = query_template % _sparql_str_literal(person_name) #E.g. %s@en becomes "Vincent van Gogh"@en
+    response_json = sparql_query(query, retries, delays) #Retries (and waiting for them) are handled inside
+    if response_json:
+        return _bindings(response_json)
+    return None
+
+
+#The occupations x work locations x ... combinations are collapsed on the server: one row per person entity,
+#with the distinct occupations and work locations (location, start, end, point in time) concatenated.
+#The single values (birth place etc.) are SAMPLEd, one per person entity: as before the grouping, the first found value is kept,
+#there is no voting (unlike in 'create_person_info_from_results').
+_GROUP_SEPARATOR = "\u001e" #ASCII record separator, between concatenated values
+_FIELD_SEPARATOR = "\u001f" #ASCII unit separator, between the fields of a work location
+_ALL_PERSON_INFO_QUERY = '''
+    SELECT ?person (SAMPLE(?placeOfBirthName) AS ?placeOfBirthLabel) (SAMPLE(?birthDate) AS ?dateOfBirth)
+           (SAMPLE(?deathDate) AS ?dateOfDeath) (SAMPLE(?placeOfDeathName) AS ?placeOfDeathLabel)
+           (SAMPLE(?genderName) AS ?genderLabel) (SAMPLE(?citizenshipName) AS ?citizenshipLabel)
+           (GROUP_CONCAT(DISTINCT ?occupationName; separator="\\u001E") AS ?occupations)
+           (GROUP_CONCAT(DISTINCT ?workLocationFields; separator="\\u001E") AS ?workLocations) WHERE {
+      ?person rdfs:label|skos:altLabel %s@en.
       OPTIONAL {?person wdt:P19 ?placeOfBirth. }
-      OPTIONAL {?person wdt:P569 ?dateOfBirth. }
-      OPTIONAL {?person wdt:P570 ?dateOfDeath. }
+      OPTIONAL {?person wdt:P569 ?birthDate. }
+      OPTIONAL {?person wdt:P570 ?deathDate. }
       OPTIONAL {?person wdt:P20 ?placeOfDeath. }
       OPTIONAL { ?person wdt:P21 ?gender. }
       OPTIONAL { ?person wdt:P27 ?citizenship. }
@@ -880,67 +1722,35 @@ def get_all_person_info(person_name, retries=3, delays = [1, 10, 60]):
         OPTIONAL { ?workStmt pq:P580 ?startTime. }
         OPTIONAL { ?workStmt pq:P582 ?endTime. }
         OPTIONAL { ?workStmt pq:P585 ?pointInTime. }
+        #The label service runs last, its labels are not bound yet at this BIND: the label is joined here instead
+        #(falling back to the ID, like the label service does)
+        OPTIONAL { ?workLocation rdfs:label ?workLocationName. FILTER(LANG(?workLocationName) = "en") }
+        BIND(CONCAT(COALESCE(STR(?workLocationName), STRAFTER(STR(?workLocation), "entity/")), "\\u001F",
+                    COALESCE(STR(?startTime), ""), "\\u001F", COALESCE(STR(?endTime), ""), "\\u001F",
+                    COALESCE(STR(?pointInTime), "")) AS ?workLocationFields)
       }
-      SERVICE wikibase:label { bd:serviceParam wikibase:language "en". }
+      SERVICE wikibase:label { bd:serviceParam wikibase:language "en".
+        ?placeOfBirth rdfs:label ?placeOfBirthName. ?placeOfDeath rdfs:label ?placeOfDeathName. ?gender rdfs:label ?genderName.
+        ?citizenship rdfs:label ?citizenshipName. ?occupation rdfs:label ?occupationName. }
     }
-    ''' % person_name.replace('"', '\"') #For the "%s"@en part, the person_name is put in there, but for quotation marks, they are escaped with a backslash (regex-like)
+    GROUP BY ?person
+    '''
 
-    for attempt in range(retries):
-        response = sparql_query(query, retries, delays)
-        
-        if response.status_code == 200: #Successful
-            data = response.json()
-            results = data.get('results', {}).get('bindings', [])
-            if results: #We could just use create_person_info_from_results here, but I keep the current code to not break anything
-                person_info = {
-                    'name': person_name,
-                    'birth_place': None,
-                    'birth_date': None,
-                    'death_date': None,
-                    'death_place': None,
-                    'gender': None,
-                    'citizenship': None,
-                    'occupation': [],
-                    'location_dates': [],
-                }
-                for result in results:
-                    if not person_info['birth_place']:
-                        person_info['birth_place'] = result.get('placeOfBirthLabel', {}).get('value', None)
-                    if not person_info['birth_date']:
-                        person_info['birth_date'] = result.get('dateOfBirth', {}).get('value', None)
-                    if not person_info['death_date']:
-                        person_info['death_date'] = result.get('dateOfDeath', {}).get('value', None)
-                    if not person_info['death_place']:
-                        person_info['death_place'] = result.get('placeOfDeathLabel', {}).get('value', None)
-                    if not person_info['gender']:
-                        person_info['gender'] = result.get('genderLabel', {}).get('value', None)
-                    if not person_info['citizenship']:
-                        person_info['citizenship'] = result.get('citizenshipLabel', {}).get('value', None)
-            
-                    occupation = result.get('occupationLabel', {}).get('value', None)
-                    if occupation and occupation not in person_info['occupation']:
-                        person_info['occupation'].append(occupation)
-                    
-                    location = result.get('workLocationLabel', {}).get('value', None)
-                    if location:
-                        location_info = {
-                            'location': location,
-                            'start_time': result.get('startTime', {}).get('value', None),
-                            'end_time': result.get('endTime', {}).get('value', None),
-                            'point_in_time': result.get('pointInTime', {}).get('value', None),
-                        }
-                        if location_info not in person_info['location_dates']:
-                            person_info['location_dates'].append(location_info)
-                return person_info
-            break #Don't need to try again, we have the data
-        else: #Some status codes are handled,it's fine now
-            print(f"Error fetching data for {person_name}, status code: {response.status_code}.")
-            if response.status_code in [429, 500, 502, 503, 504]:
-                print(f"Attempt {attempt + 1} of {retries}.")
-                time.sleep(delays[attempt])
-            else:
-                break
 
+def get_all_person_info(person_name, retries=3, delays = [1, 10, 60]):
+    """
+    Default function to get all sorts of information about a person from Wikidata.
+    This includes the person's name, birth place, birth date, death date, gender, citizenship, occupation, work locations (with time data).
+
+    Parameters:
+    - person_name, retries, delays: See at the top of the file.
+
+    Returns:
+    - dict or None: Data dictionary about the person if successful, None otherwise.
+    """
+    results = _query_person_results(_ALL_PERSON_INFO_QUERY, person_name, retries, delays)
+    if results: #We could just use create_person_info_from_results here, but I keep the current (first found values) behaviour
+        return create_full_person_info_from_results(person_name, results)
     return None
 
 
@@ -957,43 +1767,23 @@ def get_all_person_info_strict(person_name, retries=3, delays=[1, 10, 60], silen
     Returns:
     - dict or None: Data dictionary about the person if successful, None otherwise.
     """
-    
-    query = '''
-    SELECT ?person ?personLabel ?placeOfBirthLabel ?dateOfBirth ?dateOfBirthLabel ?dateOfDeath ?dateOfDeathLabel ?placeOfDeathLabel ?workLocationLabel ?startTime ?endTime ?pointInTime ?genderLabel ?citizenshipLabel ?occupationLabel WHERE {
-      ?person ?label "%s"@en.
-      ?person wdt:P31 wd:Q5.
-      OPTIONAL {?person wdt:P19 ?placeOfBirth. }
-      OPTIONAL {?person wdt:P569 ?dateOfBirth. }
-      OPTIONAL {?person wdt:P570 ?dateOfDeath. }
-      OPTIONAL {?person wdt:P20 ?placeOfDeath. }
-      OPTIONAL { ?person wdt:P21 ?gender. }
-      OPTIONAL { ?person wdt:P27 ?citizenship. }
-      OPTIONAL { ?person wdt:P106 ?occupation. }
-      OPTIONAL {
-        ?person p:P937 ?workStmt.
-        ?workStmt ps:P937 ?workLocation.
-        OPTIONAL { ?workStmt pq:P580 ?startTime. }
-        OPTIONAL { ?workStmt pq:P582 ?endTime. }
-        OPTIONAL { ?workStmt pq:P585 ?pointInTime. }
-      }
-      SERVICE wikibase:label { bd:serviceParam wikibase:language "[AUTO_LANGUAGE],en". }
-    }
-    ''' % person_name.replace('"', '\"') #For the "%s"@en part, the person_name is put in there, but for quotation marks, they are escaped with a backslash (regex-like)
-
-    response_json = sparql_query(query, retries, delays)
-    if response_json:
-        results = response_json.get('results', {}).get('bindings', [])
-        id = get_id_from_results(results)
-        if id:
-            person_info = create_person_info_from_results(person_name, results)
-            person_info['id'] = id
-            return person_info
-        else:
-            if not silent:
-                print(f"{person_name} has no valid ID.")
+    people_info = get_all_people_info_batch([person_name], retries, delays) #The same query, for one name
+    if people_info:
+        return people_info[0]
+    if not silent:
+        print(f"{person_name} not found, or has no valid ID.")
     return None
 
 
+_PERSON_WIKIDATA_NAME_QUERY = '''
+    SELECT ?person ?personLabel WHERE{
+    ?person ?label %s.
+    ?person wdt:P31 wd:Q5.
+    SERVICE wikibase:label { bd:serviceParam wikibase:language "[AUTO_LANGUAGE],*". }
+    }
+    '''
+
+
 def get_person_wikidata_name(person_name, retries = 3, delay = 1):
     """
     NOTE: If you query a person who has an English Wikipedia page, consider using get_person_wikidata_name_fast.
@@ -1007,24 +1797,30 @@ def get_person_wikidata_name(person_name, retries = 3, delay = 1):
     Returns:
     - str or None: Wikidata name of the person if successful, None otherwise.
     """
-    query = '''
+    # ?person wdt:P31 wd:Q5. : Ensure it's an instance of human, could happen that it's a statue of the person or something
+    results = _query_person_results(_PERSON_WIKIDATA_NAME_QUERY, person_name, retries, delay)
+    if results:
+        return most_common_results(['personLabel'], results) or None #The same for every row, no need to loop over them
+    return None
+
+
+_PERSON_WIKIDATA_NAME_FAST_QUERY = '''
     SELECT ?person ?personLabel WHERE{
-    ?person ?label "%s".
+    ?person rdfs:label|skos:altLabel %s@en.
     ?person wdt:P31 wd:Q5.
-    SERVICE wikibase:label { bd:serviceParam wikibase:language "[AUTO_LANGUAGE],*". }
+    SERVICE wikibase:label { bd:serviceParam wikibase:language "en". }
     }
-    '''% person_name.replace('"', '\"')
-    # ?person wdt:P31 wd:Q5. : Ensure it's an instance of human, could happen that it's a statue of the person or something
+    '''
 
-    response_json = sparql_query(query, retries, delay)
-    if response_json:
-        results = response_json.get('results', {}).get('bindings', [])
-        if results:
-            for result in results:
-                #person = result.get('person', {}).get('value', None) #wd:*Wikidata ID*
-                label = most_common_results(['personLabel'], results)
-                if label:
-                    return label
+
+def _entity_label(result):
+    """
+    The label of a result row if it belongs to a Wikidata entity (Q...), None otherwise.
+    """
+    person = _value(result, 'person')
+    label = _value(result, 'personLabel')
+    if person and 'entity/Q' in person and label:
+        return label
     return None
 
 
@@ -1038,34 +1834,11 @@ def get_person_wikidata_name_fast(person_name, retries = 3, delays=[1, 10, 60]):
     Returns:
     - str or None: Wikidata name of the person if successful, None otherwise.
     """
-    query = '''
-    SELECT ?person ?personLabel WHERE{
-    ?person ?label "%s"@en.
-    ?person wdt:P31 wd:Q5.
-    SERVICE wikibase:label { bd:serviceParam wikibase:language "en". }
-    }
-    '''% person_name.replace('"', '\"')
     # ?person wdt:P31 wd:Q5. : Ensure it's an instance of human, could happen that it's a statue of the person or something
-
-    for attempt in range(retries):
-        response = requests.get("https://query.wikidata.org/sparql", params={'query': query, 'format': 'json'})
-        
-        if response.status_code == 200: #Successful
-            data = response.json()
-            results = data.get('results', {}).get('bindings', [])
-            if results:
-                for result in results:
-                    person = result.get('person', {}).get('value', None)
-                    label = result.get('personLabel', {}).get('value', None)
-                    if person and 'entity/Q' in person and label: #We get a ton of results, and almost all of them a gibberish, so we need to filter them
-                        return label
-            else:
-                return None
-        elif response.status_code in [408, 429, 500, 502, 503, 504]:
-            time.sleep(delays[attempt])
-        elif response.status_code in [400, 404]:
-            print("Error: %s"%response.status_code, "person name: ", person_name)
-            return None
+    results = _query_person_results(_PERSON_WIKIDATA_NAME_FAST_QUERY, person_name, retries, delays)
+    if results:
+        #We get a ton of results, and almost all of them a gibberish, so we need to filter them: stop at the first valid one
+        return next(filter(None, map(_entity_label, results)), None)
     return None
 
 
@@ -1081,19 +1854,9 @@ def get_person_aliases(person_name):
     pass
 
 
-def get_person_locations(person_name, retries=3, delay=1):
-    """
-    Get all work locations of a person from Wikidata.
-    
-    Parameters:
-    - person_name, retries, delay: See at the top of the file.
-    
-    Returns:
-    - dict or None: Data dictionary about the person if successful, None otherwise.
-    """
-    query = '''
+_PERSON_LOCATIONS_QUERY = '''
     SELECT ?person ?personLabel ?placeOfBirthLabel ?placeOfDeathLabel ?workLocationLabel ?startTime ?endTime ?pointInTime WHERE {
-      ?person ?label "%s"@en.
+      ?person rdfs:label|skos:altLabel %s@en.
       ?person wdt:P19 ?placeOfBirth.
       ?person wdt:P20 ?placeOfDeath.
       OPTIONAL {
@@ -1105,20 +1868,37 @@ def get_person_locations(person_name, retries=3, delay=1):
       }
       SERVICE wikibase:label { bd:serviceParam wikibase:language "en". }
     }
-    ''' % person_name.replace('"', '\"') #For the "%s"@en part, the person_name is put in there, but for quotation marks, they are escaped with a backslash (regex-like)
-    #We already have birth data, so this function will not be used
+    '''
 
-    #Attempts till we get a response / 'retries' goes over the limit
-    response_json = sparql_query(query, retries, delay)    
-    if response_json: #Successful
-        results = response_json.get('results', {}).get('bindings', [])
-        if results:
-            person_locs = create_person_info_from_results(person_name, results)
-            return {'name': person_name, 'locations': person_locs['locations'],
-                    'location_dates': person_locs['location_dates']}
+
+def get_person_locations(person_name, retries=3, delay=1):
+    """
+    Get all work locations of a person from Wikidata.
+    
+    Parameters:
+    - person_name, retries, delay: See at the top of the file.
+    
+    Returns:
+    - dict or None: Data dictionary about the person if successful, None otherwise.
+    """
+    #We already have birth data, so this function will not be used
+    results = _query_person_results(_PERSON_LOCATIONS_QUERY, person_name, retries, delay)
+    if results:
+        person_locs = create_person_info_from_results(person_name, results)
+        return {'name': person_name, 'locations': person_locs['locations'],
+                'location_dates': person_locs['location_dates']}
     return None
 
 ######## Queries with or by Wikidata ID ########
+#Only the IDs are needed, so there is no label service (the costly part of such a small query)
+_PERSON_WIKIDATA_ID_QUERY = '''
+    SELECT ?person WHERE{
+    ?person rdfs:label|skos:altLabel %s@en.
+    ?person wdt:P31 wd:Q5.  #Ensure it's an instance of human, could happen that it's a statue of the person or something
+    }
+    '''
+
+
 def get_person_wikidata_id(person_name, retries = 3, delays = [1, 10, 60]):
     """
     Get the Wikidata ID of a person by their name.
@@ -1128,30 +1908,79 @@ def get_person_wikidata_id(person_name, retries = 3, delays = [1, 10, 60]):
     
     Returns:
     - str or None: Wikidata ID (starting with a Q) of the person if successful, None otherwise"""
-    query = '''
-    SELECT ?person ?personLabel WHERE{
-    ?person ?label "%s"@en.
-    ?person wdt:P31 wd:Q5.  #Ensure it's an instance of human, could happen that it's a statue of the person or something
-    SERVICE wikibase:label { bd:serviceParam wikibase:language "[AUTO_LANGUAGE],en". }
-    }
-    '''% person_name.replace('"', '\"')
-
-    response_json = sparql_query(query, retries, delays)
-    results = response_json.get('results', {}).get('bindings', [])
+    results = _query_person_results(_PERSON_WIKIDATA_ID_QUERY, person_name, retries, delays)
     if results:
-        ids= [result['person']['value'].split('/')[-1] for result in results]
-        acceptable_ids = [i for i in ids if re.match(r'^Q\d+$', i)]
-        if acceptable_ids:
-            return get_id_from_results(results)
-        else:
-            print(f"{person_name} has no valid IDs (none in the form Q12345..)")
+        id = get_id_from_results(results)
+        if id:
+            return id
+        print(f"{person_name} has no valid IDs (none in the form Q12345..)")
     return None
 
+#The information about people by ID is collected with two queries, {values} is replaced by the IDs (as wd:Q...),
+#one or many (see 'get_all_people_info_by_ids'). Work locations (with their dates) are queried separately:
+#in the same query, every work location statement is multiplied by every occupation and citizenship of the person.
+_ALL_PERSON_INFO_BY_ID_QUERY_TMPL = '''
+    SELECT ?person ?personLabel ?placeOfBirthLabel ?dateOfBirth ?dateOfDeath ?placeOfDeathLabel ?genderLabel ?citizenshipLabel ?occupationLabel WHERE {{
+      VALUES ?person {{ {values} }}
+      OPTIONAL {{ ?person wdt:P19 ?placeOfBirth. }}
+      OPTIONAL {{ ?person wdt:P569 ?dateOfBirth. }}
+      OPTIONAL {{ ?person wdt:P570 ?dateOfDeath. }}
+      OPTIONAL {{ ?person wdt:P20 ?placeOfDeath. }}
+      OPTIONAL {{ ?person wdt:P21 ?gender. }}
+      OPTIONAL {{ ?person wdt:P27 ?citizenship. }}
+      OPTIONAL {{ ?person wdt:P106 ?occupation. }}
+      SERVICE wikibase:label {{ bd:serviceParam wikibase:language "[AUTO_LANGUAGE],en". ?person rdfs:label ?personLabel. ?placeOfBirth rdfs:label ?placeOfBirthLabel. ?placeOfDeath rdfs:label ?placeOfDeathLabel. ?gender rdfs:label ?genderLabel. ?citizenship rdfs:label ?citizenshipLabel. ?occupation rdfs:label ?occupationLabel. }}
+    }}
+    '''
+
+#The OPTIONAL keeps a row for people without work locations too
+_WORK_LOCATIONS_BY_ID_QUERY_TMPL = '''
+    SELECT ?person ?workLocationLabel ?startTime ?endTime ?pointInTime WHERE {{
+      VALUES ?person {{ {values} }}
+      OPTIONAL {{
+        ?person p:P937 ?workStmt.
+        ?workStmt ps:P937 ?workLocation.
+        OPTIONAL {{ ?workStmt pq:P580 ?startTime. }}
+        OPTIONAL {{ ?workStmt pq:P582 ?endTime. }}
+        OPTIONAL {{ ?workStmt pq:P585 ?pointInTime. }}
+      }}
+      SERVICE wikibase:label {{ bd:serviceParam wikibase:language "[AUTO_LANGUAGE],en". ?workLocation rdfs:label ?workLocationLabel. }}
+    }}
+    '''
+
+
+def _person_info_by_id_queries(people_ids):
+    """
+    Build the (information, work locations) query pair for a list of Wikidata IDs.
+    """
+    values = ' '.join(f'wd:{id}' for id in people_ids)
+    return [_ALL_PERSON_INFO_BY_ID_QUERY_TMPL.format(values=values), _WORK_LOCATIONS_BY_ID_QUERY_TMPL.format(values=values)]
+
+
+def create_person_info_from_results_by_id(person_id, person_results, location_results):
+    """
+    Create a dictionary with person information from the results of the two by-ID queries (see _person_info_by_id_queries).
+    The work locations query has one row per statement (not multiplied by citizenships and occupations),
+    so every location is kept, there is nothing to vote on (a location with a single statement is as valid as any).
+
+    Parameters:
+    - person_id (str): The Wikidata ID of the person.
+    - person_results (list of dict): The results of the information query.
+    - location_results (list of dict): The results of the work locations query.
+
+    Returns:
+    - dict: A dictionary containing the person's information.
+    """
+    person_info = create_person_info_from_results_with_id(person_id, person_results)
+    locations = list(dict.fromkeys(_value(result, 'workLocationLabel') for result in location_results)) #Distinct, in order
+    _set_locations(person_info, location_results, [location for location in locations if location is not None])
+    return person_info
+
 
 def get_all_person_info_by_id(person_id, retries=3, delays=[1,10,60], silent = True):
     """
-    NOTE: Exhibitions are excluded currently, as they are too slow for some artists (e.g. Rubens).
     Get all information about a person from Wikidata, using their Wikidata ID.
+    The work locations are queried separately, in parallel. Exhibitions are excluded, see 'get_exhibitions_by_id'.
     
     Parameters:
     - person_id, retries, delays, silent: See at the top of the file.
@@ -1159,37 +1988,23 @@ def get_all_person_info_by_id(person_id, retries=3, delays=[1,10,60], silent = T
     Returns:
     - dict or None: Data dictionary about the person if successful, None otherwise.
     """
-    query = '''
+    info_json, locations_json = _run_queries(_person_info_by_id_queries([person_id]), retries, delays, max_workers=2)
+
+    results = _bindings(info_json)
+    location_results = _bindings(locations_json)
+    if results and location_results:
+        return create_person_info_from_results_by_id(person_id, results, location_results)
+    return None
+
 
-    SELECT ?person ?personLabel ?placeOfBirthLabel ?dateOfBirth ?dateOfDeath ?placeOfDeathLabel ?genderLabel ?countryCitizenshipLabel ?occupationLabel ?workLocationLabel ?exhibitionLabel ?collectionLabel ?influenceLabel WHERE {
+#Only the collection labels are selected and resolved (the person's label is not needed here)
+_EXHIBITIONS_BY_ID_QUERY = '''
+    SELECT ?collectionLabel WHERE {
       BIND(wd:%s AS ?person)
-      OPTIONAL { ?person wdt:P19 ?placeOfBirth. }
-      OPTIONAL { ?person wdt:P569 ?dateOfBirth. }
-      OPTIONAL { ?person wdt:P570 ?dateOfDeath. }
-      OPTIONAL { ?person wdt:P20 ?placeOfDeath. }
-      OPTIONAL { ?person wdt:P21 ?gender. }
-      OPTIONAL { ?person wdt:P27 ?countryCitizenship. }
-      OPTIONAL { ?person wdt:P106 ?occupation. }
-      OPTIONAL {
-        ?person p:P937 ?workStmt.
-        ?workStmt ps:P937 ?workLocation.
-        OPTIONAL { ?workStmt pq:P580 ?startTime. }
-        OPTIONAL { ?workStmt pq:P582 ?endTime. }
-        OPTIONAL { ?workStmt pq:P585 ?pointInTime. }
-      }
-      #OPTIONAL { ?person wdt:P6379 ?collection. } #We comment this out now. For some artists (e.g. Rubens), it's too slow
-      OPTIONAL { ?person wdt:P737 ?influence. }
-      SERVICE wikibase:label { bd:serviceParam wikibase:language "[AUTO_LANGUAGE],en". ?person rdfs:label ?personLabel. ?placeOfBirth rdfs:label ?placeOfBirthLabel. ?placeOfDeath rdfs:label ?placeOfDeathLabel. ?gender rdfs:label ?genderLabel. ?countryCitizenship rdfs:label ?countryCitizenshipLabel. ?occupation rdfs:label ?occupationLabel. ?workLocation rdfs:label ?workLocationLabel. ?collection rdfs:label ?collectionLabel. ?influence rdfs:label ?influenceLabel. }
+      ?person wdt:P6379 ?collection.
+      SERVICE wikibase:label { bd:serviceParam wikibase:language "[AUTO_LANGUAGE],en". ?collection rdfs:label ?collectionLabel. }
     }
-    
-    '''% person_id
-
-    response_json = sparql_query(query, retries, delays)
-    results = response_json.get('results', {}).get('bindings', [])
-    if results:
-        person_info = create_person_info_from_results_with_id(person_id, results)
-        return person_info
-    return None
+    '''
 
 
 def get_exhibitions_by_id(person_id, retries=3, delays=[1, 10, 60], silent = True):
@@ -1202,70 +2017,34 @@ def get_exhibitions_by_id(person_id, retries=3, delays=[1, 10, 60], silent = Tru
     Returns:
     - list or None: List of exhibitions of the person if successful, None otherwise.
     """
-    query = '''
-    SELECT ?person ?personLabel ?collectionLabel WHERE {
-      BIND(wd:%s AS ?person)
-      OPTIONAL { ?person wdt:P6379 ?collection. }
-      SERVICE wikibase:label { bd:serviceParam wikibase:language "[AUTO_LANGUAGE],en". ?person rdfs:label ?personLabel. ?collection rdfs:label ?collectionLabel. }
-    }
-    ''' % person_id
+    query = _EXHIBITIONS_BY_ID_QUERY % person_id
 
-    response_json = sparql_query(query, retries, delays)    
-    if response_json:
-        results = response_json.get('results', {}).get('bindings', [])
-        if not silent:
-            print('Results 0:', results[0])
-        if results:
-            collections = [result.get('collectionLabel', {}).get('value', None) for result in results if 'collectionLabel' in result]
-            return collections
-    return None
+    response_json = sparql_query(query, retries, delays) #Cached, unlike the streamed 'sparql_query_bindings'
+    if response_json is None:
+        return None
+    return [_value(result, 'collectionLabel') for result in _bindings(response_json) if 'collectionLabel' in result]
 
 
 def get_all_person_info_and_exhibitions_by_id(person_id, retries=3, delays = [1, 10, 60], silent = True):
-    #This may be too slow for some artists, e.g. Rubens, therefore we get an error (query 1 minute timeout)
     """
-    NOTE: This may be too slow for some artists, e.g. Rubens, for whom we can get a timeout error.
-    Consider using get_all_person_info_by_id and get_exhibitions_by_id successively.
-
     Get all information about a person from Wikidata, using their Wikidata ID, including exhibitions.
+    The information and the exhibitions are fetched with two separate queries, run in parallel
+    (one combined query timed out for some artists, e.g. Rubens, as the collections multiplied the rows of every other field).
 
     Parameters:
     - person_id, retries, delays, silent: See at the top of the file.
 
     Returns:
-    - dict or None: Data dictionary about the person if successful, None otherwise.
-    """
-    query = '''
-
-    SELECT ?person ?personLabel ?placeOfBirthLabel ?dateOfBirth ?dateOfDeath ?placeOfDeathLabel ?genderLabel ?countryCitizenshipLabel ?occupationLabel ?workLocationLabel ?exhibitionLabel ?collectionLabel ?influenceLabel WHERE {
-      BIND(wd:%s AS ?person)
-      OPTIONAL { ?person wdt:P19 ?placeOfBirth. }
-      OPTIONAL { ?person wdt:P569 ?dateOfBirth. }
-      OPTIONAL { ?person wdt:P570 ?dateOfDeath. }
-      OPTIONAL { ?person wdt:P20 ?placeOfDeath. }
-      OPTIONAL { ?person wdt:P21 ?gender. }
-      OPTIONAL { ?person wdt:P27 ?countryCitizenship. }
-      OPTIONAL { ?person wdt:P106 ?occupation. }
-      OPTIONAL {
-        ?person p:P937 ?workStmt.
-        ?workStmt ps:P937 ?workLocation.
-        OPTIONAL { ?workStmt pq:P580 ?startTime. }
-        OPTIONAL { ?workStmt pq:P582 ?endTime. }
-        OPTIONAL { ?workStmt pq:P585 ?pointInTime. }
-      }
-      OPTIONAL { ?person wdt:P6379 ?collection. }
-      OPTIONAL { ?person wdt:P737 ?influence. }
-      SERVICE wikibase:label { bd:serviceParam wikibase:language "[AUTO_LANGUAGE],en". ?person rdfs:label ?personLabel. ?placeOfBirth rdfs:label ?placeOfBirthLabel. ?placeOfDeath rdfs:label ?placeOfDeathLabel. ?gender rdfs:label ?genderLabel. ?countryCitizenship rdfs:label ?countryCitizenshipLabel. ?occupation rdfs:label ?occupationLabel. ?workLocation rdfs:label ?workLocationLabel. ?collection rdfs:label ?collectionLabel. ?influence rdfs:label ?influenceLabel. }
-    }
-    
-    '''% person_id
-
-    response_json = sparql_query(query, retries, delays)
-    if response_json:
-        results = response_json.get('results', {}).get('bindings', [])
-        if not silent:
-            print('Results 0:', results[0])
-        if results:
-            person_info = create_person_info_from_results_with_id(person_id, results)
-            return person_info
-    return None
+    - dict or None: Data dictionary about the person (with the exhibitions under 'exhibitions') if successful, None otherwise.
+        If only the exhibitions query fails, 'exhibitions' is None.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        info_future = executor.submit(get_all_person_info_by_id, person_id, retries, delays, silent)
+        exhibitions_future = executor.submit(get_exhibitions_by_id, person_id, retries, delays, silent)
+        person_info = info_future.result()
+        exhibitions = exhibitions_future.result()
+
+    if person_info is None:
+        return None
+    person_info['exhibitions'] = exhibitions
+    return person_info
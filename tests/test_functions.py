@@ -0,0 +1,193 @@
+import email.utils
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import functions as f
+
+
+def _binding(**values):
+    return {key: {'type': 'literal', 'value': value} for key, value in values.items()}
+
+
+def _response(*bindings):
+    return {'results': {'bindings': list(bindings)}}
+
+
+class _FakeResponse:
+    def __init__(self, content, status_code=200, headers=None):
+        self.content, self.status_code, self.headers = content, status_code, headers or {}
+
+
+class _FakeSession:
+    """Answers the requests with the given responses in order, and counts them."""
+    def __init__(self, *responses):
+        self.responses, self.calls, self.sent = list(responses), 0, []
+
+    def get(self, url, params=None, data=None, **kwargs):
+        self.calls += 1
+        self.sent.append((params or data)['query'])
+        return self.responses.pop(0)
+
+    post = get
+
+
+def _fake_session(monkeypatch, *responses):
+    session = _FakeSession(*responses)
+    monkeypatch.setattr(f, '_SESSION', session)
+    monkeypatch.setattr(f, '_RATE_LIMIT_PER_MINUTE', None)
+    f.clear_cache()
+    return session
+
+
+def _label_service_block(query):
+    return query[query.index('SERVICE wikibase:label'):query.index('}', query.index('SERVICE wikibase:label'))]
+
+
+def test_all_person_info_query_does_not_concat_label_service_labels():
+    #The label service runs last, so the work location label must be joined before the BIND that concatenates it
+    assert '?workLocationName' not in _label_service_block(f._ALL_PERSON_INFO_QUERY)
+    assert '?workLocation rdfs:label ?workLocationName' in f._ALL_PERSON_INFO_QUERY
+
+
+def test_get_all_person_info_without_work_locations(monkeypatch):
+    response = _response(_binding(person='http://www.wikidata.org/entity/Q5582', placeOfBirthLabel='Zundert',
+                                  dateOfBirth='1853-03-30T00:00:00Z', occupations='painter\u001edrawer'))
+    monkeypatch.setattr(f, 'sparql_query', lambda query, retries, delays: response)
+
+    person_info = f.get_all_person_info('Vincent van Gogh')
+
+    assert person_info['birth_place'] == 'Zundert'
+    assert person_info['birth_date'] == '1853-03-30T00:00:00Z'
+    assert person_info['occupation'] == ['painter', 'drawer']
+    assert person_info['location_dates'] == []
+
+
+def test_get_all_person_info_with_work_locations(monkeypatch):
+    work_locations = '\u001e'.join(['Arles\u001f1888\u001f1889\u001f', 'Paris\u001f\u001f\u001f1886', 'Arles\u001f1888\u001f1889\u001f'])
+    response = _response(_binding(person='http://www.wikidata.org/entity/Q5582', workLocations=work_locations))
+    monkeypatch.setattr(f, 'sparql_query', lambda query, retries, delays: response)
+
+    person_info = f.get_all_person_info('Vincent van Gogh')
+
+    assert person_info['location_dates'] == [
+        {'location': 'Arles', 'start_time': '1888', 'end_time': '1889', 'point_in_time': None},
+        {'location': 'Paris', 'start_time': None, 'end_time': None, 'point_in_time': '1886'},
+    ]
+
+
+def test_sparql_query_does_not_cache_invalid_body(monkeypatch, tmp_path):
+    session = _fake_session(monkeypatch, _FakeResponse(b'{"results": {"bindi'), _FakeResponse(b'{"results": {"bindings": []}}'))
+    f.enable_disk_cache(str(tmp_path / 'cache.sqlite'))
+    try:
+        assert f.sparql_query('SELECT ?item WHERE { ?item wdt:P31 wd:Q5 }') is None
+        assert f.sparql_query('SELECT ?item WHERE { ?item wdt:P31 wd:Q5 }') == {'results': {'bindings': []}}
+    finally:
+        f.disable_disk_cache()
+    assert session.calls == 2
+
+
+def test_person_info_by_id_keeps_locations_with_a_single_statement():
+    person_results = [_binding(personLabel='Vincent van Gogh', occupationLabel='painter')]
+    location_results = [_binding(workLocationLabel='Paris', startTime='1886'), _binding(workLocationLabel='Paris', startTime='1887'),
+                        _binding(workLocationLabel='Paris', startTime='1888'), _binding(workLocationLabel='Arles')]
+
+    person_info = f.create_person_info_from_results_by_id('Q5582', person_results, location_results)
+
+    assert person_info['locations'] == 'Paris,Arles'
+    assert [location['location'] for location in person_info['location_dates']] == ['Paris', 'Paris', 'Paris', 'Arles']
+
+
+def test_sparql_query_keeps_big_responses_out_of_memory_cache(monkeypatch):
+    big_body = b'{"results": {"bindings": [' + b','.join([b'{}'] * 10) + b']}}'
+    session = _fake_session(monkeypatch, _FakeResponse(big_body), _FakeResponse(big_body))
+    monkeypatch.setattr(f, '_QUERY_CACHE_MAX_ENTRY_BYTES', len(big_body) - 1)
+
+    assert f.sparql_query('SELECT ?item WHERE { ?item wdt:P31 wd:Q5 }') == f.sparql_query('SELECT ?item WHERE { ?item wdt:P31 wd:Q5 }')
+    assert session.calls == 2
+    assert f._QUERY_CACHE_BYTES == 0
+
+
+def test_sparql_query_sends_query_unchanged(monkeypatch):
+    query = 'SELECT ?item WHERE {\n  ?item rdfs:label """Two\n  lines"""@en.\n}'
+    session = _fake_session(monkeypatch, _FakeResponse(b'{"results": {"bindings": []}}'))
+
+    f.sparql_query(query)
+
+    assert session.sent == [query]
+
+
+def test_set_rate_limit_rejects_non_positive_rates():
+    for rate_per_minute, burst in [(0, 10), (-5, 10), (50, 0)]:
+        with pytest.raises(ValueError):
+            f.set_rate_limit(rate_per_minute, burst)
+    assert f._RATE_LIMIT_PER_MINUTE == 50
+
+
+def test_sparql_query_cache_round_trip_and_expiry(monkeypatch, tmp_path):
+    query = 'SELECT ?item WHERE {\n?item wdt:P31 wd:Q5\n}'
+    session = _fake_session(monkeypatch, _FakeResponse(b'{"results": {"bindings": []}}'), _FakeResponse(b'{"results": {"bindings": [{}]}}'))
+    path = str(tmp_path / 'cache.sqlite')
+    f.enable_disk_cache(path, expire_after=60)
+    try:
+        assert f.sparql_query(query) == {'results': {'bindings': []}}
+        assert f.sparql_query('\n    ' + query.replace('\n', '\n      ') + '\n') == {'results': {'bindings': []}} #Same query, in memory
+        f.disable_disk_cache()
+        f.clear_cache() #Only the memory cache, like a new session
+        f.enable_disk_cache(path, expire_after=60)
+        assert f.sparql_query(query) == {'results': {'bindings': []}} #From the disk cache
+        assert session.calls == 1
+
+        f.disable_disk_cache()
+        f.clear_cache()
+        f.enable_disk_cache(path, expire_after=60)
+        later = time.time() + 3600
+        monkeypatch.setattr(f.time, 'time', lambda: later)
+        assert f.sparql_query(query) == {'results': {'bindings': [{}]}} #Expired, fetched again
+    finally:
+        f.disable_disk_cache()
+        f.clear_cache()
+    assert session.calls == 2
+
+
+def test_retry_after_is_bounded_and_jittered(monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(f.time, 'time', lambda: now)
+    monkeypatch.setattr(f.random, 'uniform', lambda a, b: 0.5)
+
+    assert f._retry_delay(_FakeResponse(b'', 429, {'Retry-After': '5'}), 0) == 5.5
+    assert f._retry_delay(_FakeResponse(b'', 429, {'Retry-After': '100000'}), 0) == f._MAX_RETRY_AFTER + 0.5
+    retry_date = email.utils.formatdate(now + 30, usegmt=True)
+    assert 29.5 <= f._retry_delay(_FakeResponse(b'', 503, {'Retry-After': retry_date}), 0) <= 30.5
+    assert f._retry_delay(_FakeResponse(b'', 503, {'Retry-After': 'soon'}), 1, delays=[1, 10, 60]) == 10.5
+
+
+def test_sparql_query_retries_after_rate_limit(monkeypatch):
+    session = _fake_session(monkeypatch, _FakeResponse(b'', 429, {'Retry-After': '2'}), _FakeResponse(b'{"results": {"bindings": []}}'))
+    monkeypatch.setattr(f.random, 'uniform', lambda a, b: 0.5)
+    sleeps = []
+    monkeypatch.setattr(f.time, 'sleep', sleeps.append)
+
+    assert f.sparql_query('SELECT ?item WHERE { ?item wdt:P31 wd:Q5 }') == {'results': {'bindings': []}}
+    assert session.calls == 2
+    assert sleeps == [2.5]
+
+
+def test_get_all_people_info_batch_groups_results_by_name(monkeypatch):
+    bindings = [
+        _binding(name='Vincent van Gogh', person='http://www.wikidata.org/entity/Q5582', placeOfBirthLabel='Zundert', occupationLabel='painter'),
+        _binding(name='Claude Monet', person='http://www.wikidata.org/entity/Q296', placeOfBirthLabel='Paris', occupationLabel='painter'),
+        _binding(name='Vincent van Gogh', person='http://www.wikidata.org/entity/Q5582', placeOfBirthLabel='Zundert', occupationLabel='drawer'),
+    ]
+    session = _fake_session(monkeypatch, _FakeResponse(json.dumps(_response(*bindings)).encode()))
+
+    people_info = f.get_all_people_info_batch(['Vincent van Gogh', 'Claude Monet', 'Nobody'])
+
+    assert session.calls == 1
+    assert [(person_info['name'], person_info['id'], person_info['birth_place']) for person_info in people_info] == [
+        ('Vincent van Gogh', 'Q5582', 'Zundert'), ('Claude Monet', 'Q296', 'Paris')]